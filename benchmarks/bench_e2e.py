@@ -0,0 +1,201 @@
+"""
+엔드투엔드 벤치마크: 로컬 스텁 서버(RSS, 기사 HTML, Ollama/OpenAI 호환 LLM)를 띄우고
+fetch_feeds, fetch_all_feeds, get_full_text, generate_summary, auto_sum_worker 파이프라인의
+처리량과 p50/p95 지연 시간을 측정합니다.
+
+결과는 benchmarks/results/<시각>.json에 저장되며 직전 결과와 p50을 비교합니다.
+
+DB: --db-config로 로컬(벤치마크 전용) MySQL의 news_db 설정이 담긴 config.json을
+지정하면 요약 캐시/기사 저장소/피드 상태까지 포함해 측정합니다. 지정하지 않으면
+DB 없이 측정합니다.
+
+사용법:
+    python benchmarks/bench_e2e.py [--provider ollama|openai] [--iterations 20] [--items 12]
+        [--feed-latency 0.05] [--article-latency 0.1] [--llm-ttft 0.3]
+        [--llm-token-latency 0.02] [--llm-tokens 40] [--db-config config.json]
+"""
+import argparse
+import json
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCH_DIR, "..", "src")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+sys.path.append(SRC_DIR)
+sys.path.append(BENCH_DIR)
+
+import stub_servers  # noqa: E402
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(samples, wall_time=None):
+    """지연 시간 샘플(초)을 ms 단위 통계로 변환합니다."""
+    wall = wall_time if wall_time is not None else sum(samples)
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "throughput_per_s": round(len(samples) / wall, 2) if wall else None,
+    }
+
+
+def timed(fn, iterations):
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def write_configs(workdir, args, llm_url):
+    config = {}
+    if args.db_config:
+        with open(args.db_config) as f:
+            config["news_db"] = json.load(f)["news_db"]
+    with open(os.path.join(workdir, "config.json"), "w") as f:
+        json.dump(config, f)
+
+    provider = "bench-openai" if args.provider == "openai" else "bench-ollama"
+    llm_config = {
+        "custom_providers": [
+            {"name": "bench-ollama", "type": "ollama", "url": llm_url},
+            {"name": "bench-openai", "type": "openai", "url": f"{llm_url}/v1"},
+        ],
+        "selected_provider": provider,
+        f"default_model_{provider}": "bench-model",
+    }
+    llm_config_path = os.path.join(workdir, "llm_config.json")
+    with open(llm_config_path, "w") as f:
+        json.dump(llm_config, f)
+    return llm_config_path
+
+
+def run_benchmarks(args, feed_server, article_server, run_id):
+    # 모듈은 설정 파일 위치가 정해진 뒤에 임포트해야 함
+    from modules.news_manager import NewsFetcher
+    from modules.workers import auto_sum_worker
+
+    fetcher = NewsFetcher()
+    fetcher.sources = {name: f"{feed_server.url}/rss/{name}" for name in ("mk", "hani", "geeknews")}
+    model = "bench-model"
+    results = {}
+
+    def cold_fetch(i):
+        fetcher.feed_headers.clear()
+        fetcher.feed_entries.clear()
+        fetcher.fetch_feeds("mk")
+    results["fetch_feeds"] = timed(cold_fetch, args.iterations)
+
+    def cold_fetch_all(i):
+        fetcher.feed_headers.clear()
+        fetcher.feed_entries.clear()
+        fetcher.fetch_all_feeds()
+    results["fetch_all_feeds"] = timed(cold_fetch_all, args.iterations)
+
+    article_url = lambda key: f"{article_server.url}/article/{run_id}-{key}"
+    results["get_full_text"] = timed(lambda i: fetcher.get_full_text(article_url(f"text-{i}")), args.iterations)
+
+    sample_text = fetcher.get_full_text(article_url("sample"))
+    results["generate_summary"] = timed(lambda i: fetcher.generate_summary(sample_text, model), args.iterations)
+
+    # 파이프라인: 항목별 완료 시각을 시작 시점 기준으로 측정
+    items = [{"link": article_url(f"pipe-{i}"), "title": f"item {i}"} for i in range(args.items)]
+    result_queue = queue.Queue()
+    start = time.perf_counter()
+    worker = threading.Thread(
+        target=auto_sum_worker, args=(items, model, result_queue, threading.Event(), fetcher), daemon=True
+    )
+    worker.start()
+    latencies = []
+    while len(latencies) < len(items):
+        try:
+            result_queue.get(timeout=120)
+        except queue.Empty:
+            break
+        latencies.append(time.perf_counter() - start)
+    worker.join(timeout=5)
+    if latencies:
+        results["auto_sum_pipeline"] = summarize(latencies, wall_time=latencies[-1])
+    return results
+
+
+def compare_with_previous(results):
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+    previous = sorted(f for f in os.listdir(RESULTS_DIR) if f.endswith(".json"))
+    if not previous:
+        return None
+    with open(os.path.join(RESULTS_DIR, previous[-1])) as f:
+        return previous[-1], json.load(f)["results"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", choices=["ollama", "openai"], default="ollama")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--items", type=int, default=12, help="items for the pipeline benchmark")
+    parser.add_argument("--feed-latency", type=float, default=0.05)
+    parser.add_argument("--article-latency", type=float, default=0.1)
+    parser.add_argument("--llm-ttft", type=float, default=0.3)
+    parser.add_argument("--llm-token-latency", type=float, default=0.02)
+    parser.add_argument("--llm-tokens", type=int, default=40)
+    parser.add_argument("--db-config", default=None, help="config.json with a news_db section for a local bench MySQL")
+    parser.add_argument("--no-save", action="store_true", help="do not store results")
+    args = parser.parse_args()
+    if args.db_config:
+        args.db_config = os.path.abspath(args.db_config)
+
+    article_server = stub_servers.make_article_server(latency=args.article_latency).start()
+    feed_server = stub_servers.make_feed_server(article_server.url, latency=args.feed_latency).start()
+    llm_server = stub_servers.make_llm_server(
+        ttft=args.llm_ttft, token_latency=args.llm_token_latency, tokens=args.llm_tokens
+    ).start()
+
+    workdir = tempfile.mkdtemp(prefix="news_reader_bench_")
+    os.environ["NEWS_READER_LLM_CONFIG"] = write_configs(workdir, args, llm_server.url)
+    os.chdir(workdir)  # config.json과 data_usage.json을 임시 디렉터리에서 사용
+
+    run_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+    try:
+        results = run_benchmarks(args, feed_server, article_server, run_id)
+    finally:
+        for server in (feed_server, article_server, llm_server):
+            server.stop()
+
+    previous = compare_with_previous(results)
+    print(f"{'benchmark':<20}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'ops/s':>9}{'Δp50 vs prev':>16}")
+    for name, stats in results.items():
+        delta = ""
+        if previous and name in previous[1]:
+            before = previous[1][name]["p50_ms"]
+            delta = f"{(stats['p50_ms'] - before) / before * 100:+.1f}%" if before else ""
+        print(f"{name:<20}{stats['count']:>5}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['throughput_per_s'] or 0:>9.2f}{delta:>16}")
+    if previous:
+        print(f"(compared with {previous[0]})")
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{run_id}.json")
+        with open(path, "w") as f:
+            json.dump({"run_id": run_id, "settings": vars(args), "results": results}, f, indent=2)
+        print(f"Saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+기사 본문 추출 벤치마크: 기존 html.parser 경로 vs ArticleExtractor.
+
+사용법:
+    python benchmarks/bench_extraction.py [--fixtures DIR] [--iterations N]
+
+DIR에는 HTML 파일과 파일명 -> 원본 URL을 매핑하는 index.json이 있어야 합니다.
+실제 사이트에서 저장한 페이지를 넣으면 사이트 규칙 효과를 확인할 수 있습니다.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bs4 import BeautifulSoup
+from modules.extractor import ArticleExtractor
+
+
+def legacy_extract(content, url):
+    """기존 NewsFetcher.get_full_text의 추출 경로 (비교 기준)."""
+    soup = BeautifulSoup(content, 'html.parser')
+
+    for script in soup(["script", "style", "nav", "header", "footer"]):
+        script.decompose()
+
+    article_body = soup.find(attrs={"itemprop": "articleBody"})
+    article_tag = soup.find('article')
+    class_candidates = soup.find_all('div', class_=lambda x: x and x in ['art_txt', 'view_txt', 'news_view'])
+
+    target_element = None
+    if article_body:
+        target_element = article_body
+    elif article_tag:
+        target_element = article_tag
+    elif class_candidates:
+        target_element = soup.new_tag('div')
+        for c in class_candidates:
+            target_element.append(c)
+
+    text_content = []
+    if target_element:
+        for pre in target_element.find_all('pre'):
+            code_text = pre.get_text()
+            pre.string = f"\n```\n{code_text}\n```\n"
+        for ul in target_element.find_all('ul'):
+            for li in ul.find_all('li'):
+                li.string = f"- {li.get_text()}"
+        for i in range(1, 4):
+            for h in target_element.find_all(f'h{i}'):
+                h.string = f"\n{'#' * i} {h.get_text()}\n"
+        text = target_element.get_text(separator='\n\n')
+        text = re.sub(r'\n{3,}', '\n\n', text)
+        text_content.append(text.strip())
+    else:
+        for p in soup.find_all('p'):
+            txt = p.get_text().strip()
+            if len(txt) > 40:
+                text_content.append(txt)
+
+    text = '\n\n'.join(text_content)
+    return text if text else "Could not extract text content. Site structure might be complex."
+
+
+def time_call(fn, content, url, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(content, url)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=default_dir)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with open(os.path.join(args.fixtures, "index.json")) as f:
+        index = json.load(f)
+
+    extractor = ArticleExtractor()
+    print(f"Parser: {extractor.parser}, iterations: {args.iterations}")
+    print(f"{'fixture':<24}{'KB':>8}{'legacy ms':>12}{'engine ms':>12}{'speedup':>10}{'same text':>11}")
+
+    total_legacy = total_engine = 0.0
+    for name, url in index.items():
+        with open(os.path.join(args.fixtures, name), "rb") as f:
+            content = f.read()
+        legacy_ms = time_call(legacy_extract, content, url, args.iterations)
+        engine_ms = time_call(extractor.extract, content, url, args.iterations)
+        same = legacy_extract(content, url) == extractor.extract(content, url)
+        total_legacy += legacy_ms
+        total_engine += engine_ms
+        print(f"{name:<24}{len(content) / 1024:>8.1f}{legacy_ms:>12.2f}{engine_ms:>12.2f}"
+              f"{legacy_ms / engine_ms:>9.1f}x{str(same):>11}")
+
+    print(f"{'total':<24}{'':>8}{total_legacy:>12.2f}{total_engine:>12.2f}{total_legacy / total_engine:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
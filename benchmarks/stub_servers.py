@@ -0,0 +1,170 @@
+"""
+벤치마크용 로컬 스텁 서버: RSS 피드, 기사 HTML, Ollama/OpenAI 호환 LLM 엔드포인트.
+
+모든 서버는 127.0.0.1의 임의 포트에서 백그라운드 스레드로 실행되며, 응답 지연을
+설정할 수 있습니다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+STUB_SUMMARY = (
+    "- The government announced a new plan for the chip industry.\n"
+    "- It includes tax support and training programs.\n"
+    "- Research spending will also increase."
+)
+
+
+class StubServer:
+    """ThreadingHTTPServer를 백그라운드 스레드에서 실행하는 래퍼."""
+    def __init__(self, handler_class):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연된 ACK로 인한 40ms 지연 방지
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def make_feed_server(article_base_url, items_per_feed=5, latency=0.05):
+    """
+    /rss/<source> 경로로 RSS 2.0 피드를 제공합니다. ETag를 지원하므로
+    If-None-Match가 일치하면 304를 반환합니다.
+    """
+    class FeedHandler(_QuietHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            source = self.path.rstrip("/").split("/")[-1]
+            now = time.time()
+            items = "".join(
+                f"<item><title>{source} article {i}</title>"
+                f"<link>{article_base_url}/article/{source}-{i}</link>"
+                f"<pubDate>{formatdate(now - i * 60)}</pubDate></item>"
+                for i in range(items_per_feed)
+            )
+            body = (
+                '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                f"<title>{source}</title>{items}</channel></rss>"
+            ).encode("utf-8")
+            etag = '"' + hashlib.md5(source.encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, headers={"ETag": etag})
+                return
+            self._send(200, body, "application/rss+xml; charset=utf-8", {"ETag": etag})
+
+    return StubServer(FeedHandler)
+
+
+def make_article_server(latency=0.1):
+    """/article/<id> 경로로 fixtures의 HTML을 돌아가며 제공합니다."""
+    with open(os.path.join(FIXTURES_DIR, "index.json")) as f:
+        names = list(json.load(f).keys())
+    pages = []
+    for name in names:
+        with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+            pages.append(f.read())
+
+    class ArticleHandler(_QuietHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            key = self.path.rstrip("/").split("/")[-1]
+            page = pages[int(hashlib.md5(key.encode()).hexdigest(), 16) % len(pages)]
+            self._send(200, page)
+
+    return StubServer(ArticleHandler)
+
+
+def make_llm_server(ttft=0.3, token_latency=0.02, tokens=40):
+    """
+    Ollama(/api/generate, /api/tags)와 OpenAI 호환(/v1/chat/completions, /v1/models)
+    엔드포인트를 제공합니다. 첫 토큰까지 ttft초, 이후 토큰마다 token_latency초가 걸립니다.
+    """
+    words = STUB_SUMMARY.split(" ")
+    chunks = [(w if i == 0 else " " + w) for i, w in enumerate((words * (tokens // len(words) + 1))[:tokens])]
+
+    class LLMHandler(_QuietHandler):
+        def do_GET(self):
+            if self.path.endswith("/api/tags"):
+                body = {"models": [{"name": "bench-model"}]}
+            else:
+                body = {"data": [{"id": "bench-model"}]}
+            self._send(200, json.dumps(body).encode(), "application/json")
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def _stream(self, lines, content_type):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            time.sleep(ttft)
+            for line in lines:
+                data = line.encode("utf-8")
+                self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+                time.sleep(token_latency)
+            self.wfile.write(b"0\r\n\r\n")
+
+        def do_POST(self):
+            payload = self._read_json()
+            stream = payload.get("stream", False)
+            if self.path.endswith("/api/generate"):
+                if stream:
+                    lines = [json.dumps({"response": c, "done": False}) + "\n" for c in chunks]
+                    lines.append(json.dumps({"response": "", "done": True}) + "\n")
+                    self._stream(lines, "application/x-ndjson")
+                else:
+                    time.sleep(ttft + token_latency * len(chunks))
+                    body = {"response": "".join(chunks), "done": True}
+                    self._send(200, json.dumps(body).encode(), "application/json")
+            elif self.path.endswith("/chat/completions"):
+                if stream:
+                    lines = [
+                        "data: " + json.dumps({"choices": [{"delta": {"content": c}}]}) + "\n\n"
+                        for c in chunks
+                    ]
+                    lines.append("data: [DONE]\n\n")
+                    self._stream(lines, "text/event-stream")
+                else:
+                    time.sleep(ttft + token_latency * len(chunks))
+                    body = {"choices": [{"message": {"content": "".join(chunks)}}]}
+                    self._send(200, json.dumps(body).encode(), "application/json")
+            else:
+                self._send(404)
+
+    return StubServer(LLMHandler)
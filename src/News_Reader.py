@@ -1,6 +1,6 @@
 import streamlit as st
 
-from modules.news_manager import NewsFetcher, NewsDatabase
+from modules.news_manager import NewsFetcher, get_database
 from modules.llm_manager import LLMManager
 from modules.workers import auto_sum_worker
 from modules.ui_components import render_sidebar
@@ -8,6 +8,8 @@ import time
 import queue
 import threading
 
+SAVED_PAGE_SIZE = 20  # Saved News 페이지당 기사 수
+
 # 페이지 설정
 st.set_page_config(page_title="News Reader", page_icon=None, layout="wide")
 
@@ -35,7 +37,7 @@ if 'llm_manager' not in st.session_state:
 if 'fetcher' not in st.session_state:
     st.session_state.fetcher = NewsFetcher()
 if 'db' not in st.session_state:
-    st.session_state.db = NewsDatabase()
+    st.session_state.db = get_database()
 
 llm_manager = st.session_state.llm_manager
 fetcher = st.session_state.fetcher
@@ -56,7 +58,7 @@ if mode == "Live News":
     # 소스 선택 및 새로고침 버튼
     # config는 sidebar 상단에서 이미 로드됨
     default_source = config.get("default_source")
-    source_options = list(fetcher.sources.keys())
+    source_options = [NewsFetcher.ALL_SOURCES] + list(fetcher.sources.keys())
     source_index = source_options.index(default_source) if default_source in source_options else 0
 
     def on_source_change():
@@ -79,6 +81,7 @@ if mode == "Live News":
 
     # 새로고침 로직
     should_refresh = manual_refresh
+    daemon_mode = fetcher.config.get('ingest_daemon', {}).get('enabled', False)
         
     # 자동 새로고침 타이머
     if refresh_interval > 0:
@@ -91,9 +94,25 @@ if mode == "Live News":
     
     if should_refresh or 'current_source' not in st.session_state or st.session_state.current_source != source:
         with st.spinner("Fetching news feed..."):
-            new_items = fetcher.fetch_feeds(source)
+            stored_items = None
+            if daemon_mode and not manual_refresh:
+                # 수집 데몬이 미리 가져온 항목으로 즉시 렌더링 (네트워크 없음)
+                stored_items = fetcher.load_stored_feeds(source)
+            if stored_items:
+                new_items = stored_items
+            elif source == NewsFetcher.ALL_SOURCES:
+                new_items = fetcher.fetch_all_feeds()
+            else:
+                new_items = fetcher.fetch_feeds(source)
             
-            if new_items is None:
+            # 저장된 항목을 쓴 경우에는 데몬이 만든 새 요약을 반영하도록 항상 다시 채움
+            unchanged = (
+                not stored_items
+                and fetcher.is_not_modified(source)
+                and st.session_state.get('current_source') == source
+                and st.session_state.get('news_items')
+            )
+            if new_items is None or unchanged:
                 st.toast("No new articles found.")
                 st.session_state.last_update = time.time() # 변경 사항이 없어도 타이머 재설정
             else:
@@ -103,21 +122,23 @@ if mode == "Live News":
                 if 'stop_event' in st.session_state:
                     st.session_state.stop_event.set()
                     
-                # DB에서 요약 미리 가져오기
+                # DB에서 요약 미리 가져오기 (데몬 모드에서는 미스를 캐시하지 않아 데몬이 쓴 요약이 바로 보임)
                 st.session_state.summaries = {}
-                for item in st.session_state.news_items:
-                    cached = db.get_summary_from_cache(item['link'])
-                    if cached:
-                        formatted_cached = {
-                            'text': cached['summary'],
-                            'meta': {
-                                'source': 'Cache',
-                                'time': 'N/A',
-                                'host': 'DB',
-                                'model': cached.get('model', 'Unknown')
-                            }
+                cached_map = db.get_summaries_from_cache(
+                    [item['link'] for item in st.session_state.news_items],
+                    cache_misses=not daemon_mode
+                )
+                for link, cached in cached_map.items():
+                    formatted_cached = {
+                        'text': cached['summary'],
+                        'meta': {
+                            'source': 'Cache',
+                            'time': 'N/A',
+                            'host': 'DB',
+                            'model': cached.get('model', 'Unknown')
                         }
-                        st.session_state.summaries[item['link']] = formatted_cached
+                    }
+                    st.session_state.summaries[link] = formatted_cached
 
     if not st.session_state.news_items:
         st.info("No news items found or unable to fetch.")
@@ -194,26 +215,30 @@ if mode == "Live News":
                 # Show Summary
                 if item['link'] in st.session_state.summaries:
                     c_btn, c_summary = st.columns([0.08, 0.92])
+                    summary_slot = c_summary.empty()
                     with c_btn:
                          st.write("") # Vertical alignment spacer
                          if st.button("🔄", key=f"regen_btn_{i}", help="Regenerate Summary"):
-                             with st.spinner("..."):
-                                 link = item['link']
-                                 # 텍스트가 메모리에 없으면 가져오기
-                                 if link not in st.session_state.fetched_texts:
+                             link = item['link']
+                             # 텍스트가 메모리에 없으면 가져오기
+                             if link not in st.session_state.fetched_texts:
+                                 with st.spinner("..."):
                                      st.session_state.fetched_texts[link] = fetcher.get_full_text(link)
-                                 
-                                 full_text = st.session_state.fetched_texts[link]
-                                 model_to_use = st.session_state.get('selected_model')
-                                 
-                                 if model_to_use:
-                                    summary_data = fetcher.generate_summary(full_text, model=model_to_use, link=link, force_refresh=True)
-                                    st.session_state.summaries[link] = summary_data
-                                    st.rerun()
-                                 else:
-                                    st.error("No Model")
+                             
+                             full_text = st.session_state.fetched_texts[link]
+                             model_to_use = st.session_state.get('selected_model')
+                             
+                             if model_to_use:
+                                # 요약 영역에 토큰이 생성되는 대로 표시
+                                stream = fetcher.stream_summary(full_text, model=model_to_use, link=link, force_refresh=True)
+                                with summary_slot.container():
+                                    st.write_stream(stream)
+                                st.session_state.summaries[link] = stream.result
+                                st.rerun()
+                             else:
+                                st.error("No Model")
 
-                    with c_summary:
+                    with summary_slot.container():
                         data = st.session_state.summaries[item['link']]
                         if isinstance(data, dict):
                             text_content = data.get('text') or data.get('summary') or "Error: No text"
@@ -221,7 +246,10 @@ if mode == "Live News":
                         else:
                             st.info(data)
 
-                st.caption(f"Published: {item['published']}")
+                if st.session_state.get('current_source') == NewsFetcher.ALL_SOURCES:
+                    st.caption(f"Published: {item['published']} · {item['source']}")
+                else:
+                    st.caption(f"Published: {item['published']}")
                 
                 if st.session_state.get('expanded_id') == i:
                     st.markdown("---")
@@ -261,18 +289,62 @@ if mode == "Live News":
 
 elif mode == "Saved News":
     st.header("Saved Articles")
-    saved_items = db.get_saved_articles()
-    
-    if not saved_items:
-        st.info("No saved articles found.")
+
+    # 키셋 페이지네이션: 각 페이지 시작 커서를 스택으로 유지
+    if 'saved_page_cursors' not in st.session_state:
+        st.session_state.saved_page_cursors = [None]
+    if 'saved_contents' not in st.session_state:
+        st.session_state.saved_contents = {}
+
+    cursors = st.session_state.saved_page_cursors
+
+    def render_saved_item(item):
+         with st.expander(f"{item['title']} (Saved: {item['created_at']})"):
+             st.markdown(f"**Source:** {item['source']}")
+             if item.get('comment'):
+                 st.warning(f"**Note:** {item['comment']}")
+             st.markdown("**Summary:**")
+             st.info(item['summary'])
+             st.markdown("**Full Text:**")
+             # 본문은 요청 시에만 불러옴
+             if item['id'] in st.session_state.saved_contents:
+                 st.text(st.session_state.saved_contents[item['id']])
+             elif st.button("Load full text", key=f"load_content_{item['id']}"):
+                 st.session_state.saved_contents[item['id']] = db.get_article_content(item['id']) or ""
+                 st.rerun()
+             st.markdown(f"[Original Link]({item['link']})")
+
+    search_query = st.text_input("Search", key="saved_search", placeholder="Search saved articles...", label_visibility="collapsed")
+
+    if search_query.strip():
+        start = time.time()
+        results = db.search_articles(search_query, limit=SAVED_PAGE_SIZE)
+        st.caption(f"{len(results)} results ({(time.time() - start) * 1000:.0f} ms)")
+        if not results:
+            st.info("No matching articles.")
+        for item in results:
+            st.caption(f"…{item['snippet']}… (score {item['score']:.2f})")
+            render_saved_item(item)
     else:
-        for item in saved_items:
-             with st.expander(f"{item['title']} (Saved: {item['created_at']})"):
-                 st.markdown(f"**Source:** {item['source']}")
-                 if item.get('comment'):
-                     st.warning(f"**Note:** {item['comment']}")
-                 st.markdown("**Summary:**")
-                 st.info(item['summary'])
-                 st.markdown("**Full Text:**")
-                 st.text(item['content'])
-                 st.markdown(f"[Original Link]({item['link']})")
+        page_rows = db.get_saved_articles(limit=SAVED_PAGE_SIZE + 1, before=cursors[-1])
+        has_more = len(page_rows) > SAVED_PAGE_SIZE
+        saved_items = page_rows[:SAVED_PAGE_SIZE]
+        
+        if not saved_items:
+            st.info("No saved articles found.")
+        else:
+            for item in saved_items:
+                render_saved_item(item)
+
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if len(cursors) > 1 and st.button("◀ Newer", key="saved_prev"):
+                cursors.pop()
+                st.rerun()
+        with col_page:
+            st.caption(f"Page {len(cursors)}")
+        with col_next:
+            if has_more and st.button("Older ▶", key="saved_next"):
+                last = saved_items[-1]
+                cursors.append((last['created_at'], last['id']))
+                st.rerun()
@@ -0,0 +1,149 @@
+"""
+Streamlit 세션과 무관하게 피드를 수집하고 요약을 미리 생성하는 백그라운드 데몬.
+
+주기적으로 NewsFetcher.sources의 모든 피드를 가져오고(tb_feed_state), 기사 본문을
+추출해 기사 저장소(tb_article_store)에 넣고, 요약을 생성해 tb_summary_cache에
+저장합니다. config.json에서 ingest_daemon.enabled를 true로 두면 Streamlit 페이지는
+저장된 데이터로 바로 렌더링합니다.
+
+사용법:
+    python src/ingest_daemon.py [--interval 300] [--model MODEL] [--once] [--metrics-port 9108]
+
+--metrics-port를 주면 http://localhost:PORT/metrics 에서 단계별 지연 히스토그램을
+Prometheus 텍스트 형식으로 제공합니다.
+"""
+import argparse
+import http.server
+import logging
+import queue
+import signal
+import threading
+import time
+
+from modules.metrics_manager import LATENCY
+from modules.news_manager import NewsFetcher, get_database
+from modules.workers import SummaryPipeline
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("ingest_daemon")
+
+
+def resolve_model(fetcher, requested=None):
+    """사용할 모델: 인자 > 제공자별 기본 모델 > 제공자의 첫 번째 모델."""
+    if requested:
+        return requested
+    llm_manager = fetcher.llm_manager
+    model = llm_manager.get_context_default_model()
+    if model:
+        return model
+    models = llm_manager.get_models()
+    return models[0] if models else None
+
+
+def render_metrics():
+    """지연 히스토그램과 요약 캐시 카운터를 Prometheus 텍스트 형식으로 반환합니다."""
+    cache_stats = get_database().get_cache_stats()
+    lines = [LATENCY.render_prometheus().rstrip("\n")]
+    for key in ('hits', 'misses'):
+        name = f"news_reader_summary_cache_{key}_total"
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {cache_stats[key]}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port):
+    """백그라운드 스레드에서 /metrics 엔드포인트를 엽니다."""
+    server = http.server.ThreadingHTTPServer(("", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics on :{port}/metrics")
+    return server
+
+
+def run_cycle(fetcher, model, stop_event):
+    """피드 수집 -> 본문 추출 -> 요약 생성을 한 번 실행합니다."""
+    start = time.time()
+    items = fetcher.fetch_all_feeds()
+    logger.info(f"Fetched {len(items)} items from {len(fetcher.sources)} sources.")
+
+    if model:
+        results = queue.Queue()
+        SummaryPipeline(fetcher, model, results, stop_event).run(items)
+        live = 0
+        while not results.empty():
+            _, summary_data = results.get_nowait()
+            if summary_data.get('meta', {}).get('source') == 'Live':
+                live += 1
+        logger.info(f"Summaries: {live} generated, {len(items) - live} already cached.")
+    else:
+        # 모델을 찾을 수 없으면 본문만 미리 가져옴
+        logger.warning("No LLM model available; only prefetching article text.")
+        for item in items:
+            if stop_event.is_set():
+                break
+            fetcher.get_full_text(item['link'])
+
+    # 주기적인 캐시 정리 작업
+    get_database().evict_summary_cache()
+    logger.info(f"Cycle finished in {time.time() - start:.1f}s.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=int, default=None, help="poll interval in seconds")
+    parser.add_argument("--model", default=None, help="LLM model (default: provider default model)")
+    parser.add_argument("--once", action="store_true", help="run one cycle and exit")
+    parser.add_argument("--metrics-port", type=int, default=None, help="serve Prometheus metrics on this port")
+    args = parser.parse_args()
+
+    fetcher = NewsFetcher()
+    daemon_config = fetcher.config.get('ingest_daemon', {})
+    interval = args.interval or int(daemon_config.get('interval', 300))
+
+    # 스키마 마이그레이션을 시작 시 한 번 실행
+    if not get_database().migrate():
+        logger.error("Database is not available; exiting.")
+        return 1
+
+    metrics_port = args.metrics_port or daemon_config.get('metrics_port')
+    if metrics_port:
+        start_metrics_server(int(metrics_port))
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info("Stopping...")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    while not stop_event.is_set():
+        model = resolve_model(fetcher, args.model or daemon_config.get('model'))
+        try:
+            run_cycle(fetcher, model, stop_event)
+        except Exception as e:
+            logger.error(f"Ingest cycle error: {e}")
+        if args.once:
+            break
+        stop_event.wait(interval)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
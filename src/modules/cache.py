@@ -0,0 +1,70 @@
+import threading
+import time
+from collections import OrderedDict
+
+# get()에서 "캐시에 없음"을 나타내는 값 (None은 캐시된 '미스'로 저장될 수 있으므로 구분)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    크기와 TTL 제한이 있는 스레드 안전 LRU 캐시.
+
+    None 값도 저장할 수 있으므로 DB 조회 결과가 '없음'인 경우(네거티브 캐시)에도
+    사용할 수 있습니다. 항목이 없거나 만료되면 get()은 MISSING을 반환합니다.
+
+    속성:
+        max_size (int): 최대 항목 수. 초과하면 가장 오래 사용되지 않은 항목부터 제거.
+        ttl (float): 항목 유효 시간(초).
+        hits (int): get()이 캐시에서 값을 찾은 횟수.
+        misses (int): get()이 MISSING을 반환한 횟수.
+    """
+    def __init__(self, max_size=512, ttl=600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
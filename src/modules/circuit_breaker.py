@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+# config.json의 "circuit_breaker" 섹션 기본값
+DEFAULT_BREAKER_CONFIG = {
+    "failure_threshold": 3,     # 연속 실패가 이 횟수에 도달하면 open
+    "cooldown": 30,             # open 후 half-open으로 전환하기까지의 시간(초)
+    "window": 50,               # 적응형 타임아웃 계산에 쓰는 최근 응답 시간 샘플 수
+    "min_samples": 5,           # 이보다 샘플이 적으면 기본 타임아웃 사용
+    "timeout_multiplier": 3.0,  # 적응형 타임아웃 = p95 * multiplier
+    "min_timeout": 2.0,         # 적응형 타임아웃 하한(초) - 기사 다운로드
+    "llm_min_timeout": 60.0,    # LLM 호출의 하한(초). 잠든 서버의 모델 콜드 로드 시간보다 충분히 길게
+    "llm_connect_timeout": 3.05,  # LLM 호출의 연결 타임아웃(초). 고정값, 읽기 타임아웃과 별도
+}
+
+_REGISTRY = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+class CircuitOpenError(Exception):
+    """breaker가 open 상태여서 요청을 보내지 않고 바로 실패한 경우."""
+
+
+class CircuitBreaker:
+    """
+    호스트 하나에 대한 서킷 브레이커 (closed -> open -> half-open -> closed).
+
+    연속 실패가 failure_threshold에 도달하면 open되어 cooldown 동안 요청을 즉시
+    거부하고(CircuitOpenError), 이후 half-open에서 한 번의 시험 요청이 성공하면 다시
+    closed가 됩니다. 성공한 요청의 응답 시간으로 p95를 추적해 timeout()이 호출자의
+    기본 타임아웃보다 짧은 적응형 타임아웃을 돌려줍니다. 샘플은 kind별로 따로 모읍니다
+    (예: 스트리밍은 첫 조각까지의 시간, 일반 호출은 전체 응답 시간).
+    """
+    def __init__(self, name, settings):
+        self.name = name
+        self.settings = settings
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_started = None
+        self.last_error = None
+        self._samples = {}  # kind -> deque of seconds
+        self._lock = threading.Lock()
+
+    def _refresh(self, now):
+        if self.state == OPEN and now - self.opened_at >= self.settings['cooldown']:
+            self.state = HALF_OPEN
+            self.trial_started = None
+
+    def before_call(self):
+        """요청 전에 호출합니다. open이거나 half-open 시험 요청이 진행 중이면 CircuitOpenError."""
+        now = time.monotonic()
+        with self._lock:
+            self._refresh(now)
+            if self.state == OPEN:
+                raise CircuitOpenError(f"circuit open for {self.name}")
+            if self.state == HALF_OPEN:
+                # 중단된 시험 요청이 슬롯을 영구히 잡지 않도록 cooldown이 지나면 다시 허용
+                if self.trial_started is not None and now - self.trial_started < self.settings['cooldown']:
+                    raise CircuitOpenError(f"circuit half-open for {self.name}, trial in progress")
+                self.trial_started = now
+
+    def record_success(self, seconds, kind="response"):
+        with self._lock:
+            samples = self._samples.get(kind)
+            if samples is None:
+                samples = self._samples[kind] = deque(maxlen=int(self.settings['window']))
+            samples.append(seconds)
+            if self.state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed.")
+            self.state = CLOSED
+            self.failures = 0
+            self.trial_started = None
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error else None
+            if self.state == HALF_OPEN or self.failures >= self.settings['failure_threshold']:
+                if self.state != OPEN:
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} failures: {error}")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.trial_started = None
+
+    def p95(self, kind="response"):
+        with self._lock:
+            samples = self._samples.get(kind, ())
+            if len(samples) < self.settings['min_samples']:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def timeout(self, default, kind="response", min_timeout=None):
+        """
+        p95 * timeout_multiplier를 [min_timeout, default] 범위로 제한한 타임아웃(초).
+
+        min_timeout을 주지 않으면 설정의 min_timeout을 사용합니다.
+        """
+        p95 = self.p95(kind)
+        if p95 is None:
+            return default
+        if min_timeout is None:
+            min_timeout = self.settings['min_timeout']
+        adaptive = p95 * self.settings['timeout_multiplier']
+        return min(default, max(min_timeout, adaptive))
+
+    def snapshot(self):
+        with self._lock:
+            self._refresh(time.monotonic())
+            state, failures, last_error = self.state, self.failures, self.last_error
+            kinds = sorted(self._samples)
+        p95 = {kind: self.p95(kind) for kind in kinds}
+        return {
+            'name': self.name,
+            'state': state,
+            'failures': failures,
+            'p95_ms': {kind: round(v * 1000, 1) for kind, v in p95.items() if v is not None},
+            'last_error': last_error,
+        }
+
+
+class BreakerRegistry:
+    """호스트 이름별 CircuitBreaker를 만들어 보관합니다 (프로세스 전역)."""
+    def __init__(self, settings=None):
+        self.settings = dict(DEFAULT_BREAKER_CONFIG, **(settings or {}))
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, CircuitBreaker(name, self.settings))
+        return breaker
+
+    def snapshot(self):
+        with self._lock:
+            breakers = sorted(self._breakers.values(), key=lambda b: b.name)
+        return [b.snapshot() for b in breakers]
+
+
+def _load_breaker_config(config_file):
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, 'r') as f:
+                return json.load(f).get('circuit_breaker', {})
+        except Exception as e:
+            logger.error(f"Error loading circuit breaker config: {e}")
+    return {}
+
+
+def get_breakers(config_file='config.json'):
+    """
+    NewsFetcher와 LLMManager가 공유하는 프로세스 전역 BreakerRegistry를 반환합니다.
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = BreakerRegistry(_load_breaker_config(config_file))
+    return _REGISTRY
@@ -0,0 +1,261 @@
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401 - C 기반 파서 사용 가능 여부 확인
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# 본문과 무관한 태그 (추출 전에 제거)
+NOISE_TAGS = ["script", "style", "nav", "header", "footer"]
+
+# 사이트별 규칙: 도메인 -> 본문 컨테이너 규칙 목록 (순서대로 시도)
+# 규칙 형식: {"tag": "div", "attrs": {"class": "art_txt"}, "all": false}
+#   all이 true이면 일치하는 모든 요소를 합칩니다.
+# config.json의 extraction.site_rules로 추가/재정의할 수 있습니다.
+DEFAULT_SITE_RULES = {
+    "mk.co.kr": [
+        {"attrs": {"itemprop": "articleBody"}},
+        {"tag": "div", "attrs": {"class": ["art_txt", "news_view"]}, "all": True},
+    ],
+}
+
+# 사이트 규칙이 없거나 실패했을 때의 일반 규칙 (우선순위 순)
+GENERIC_RULES = [
+    {"attrs": {"itemprop": "articleBody"}},
+    {"tag": "article"},
+    {"tag": "div", "attrs": {"class": ["art_txt", "view_txt", "news_view"]}, "all": True},
+]
+
+GOOGLE_NEWS_BLOCKED = "⚠️ Content extraction failed. Google News often blocks full-text extraction tools. Please use the 'Link' button to read the original article."
+EXTRACTION_FAILED = "Could not extract text content. Site structure might be complex."
+
+_NEWLINES = re.compile(r'\n{3,}')
+
+
+def _class_matcher(classes):
+    """
+    class 속성을 공백으로 나눠 classes 중 하나라도 포함하면 일치하는 함수.
+
+    SoupStrainer는 class 문자열 전체를 비교하므로 "art_txt foo" 같은 다중 클래스
+    요소를 놓칩니다 (find()/find_all()은 클래스별로 비교).
+    """
+    wanted = {classes} if isinstance(classes, str) else set(classes)
+    return lambda value: bool(value) and not wanted.isdisjoint(value.split())
+
+
+def _strainer(rule):
+    """사이트 규칙으로 SoupStrainer를 만듭니다."""
+    attrs = dict(rule.get('attrs', {}))
+    if 'class' in attrs:
+        attrs['class'] = _class_matcher(attrs['class'])
+    return SoupStrainer(rule.get('tag'), attrs=attrs)
+
+
+class ArticleExtractor:
+    """
+    HTML에서 기사 본문을 추출하는 엔진.
+
+    가능하면 C 기반 lxml 파서를 사용하고, 사이트 규칙이 있는 도메인은
+    SoupStrainer로 본문 컨테이너만 트리로 만듭니다. 규칙이 맞지 않으면 전체
+    문서를 파싱해 일반 규칙과 <p> 폴백을 적용합니다.
+
+    속성:
+        parser (str): BeautifulSoup 파서 이름.
+        site_rules (dict): 도메인별 규칙 목록.
+    """
+    def __init__(self, site_rules=None, parser=None):
+        self.parser = parser or DEFAULT_PARSER
+        self.site_rules = dict(DEFAULT_SITE_RULES)
+        if site_rules:
+            self.site_rules.update(site_rules)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        config.json의 extraction 섹션으로 추출기를 만듭니다.
+
+        extraction.process_workers가 0보다 크면 같은 인터페이스의
+        ProcessPoolExtractor를 반환합니다.
+        """
+        extraction = config.get('extraction', {})
+        extractor = cls(site_rules=extraction.get('site_rules'), parser=extraction.get('parser'))
+        workers = int(extraction.get('process_workers', 0))
+        if workers > 0:
+            return ProcessPoolExtractor(extractor, workers, timeout=float(extraction.get('process_timeout', 30)))
+        return extractor
+
+    def rules_for(self, url):
+        """URL 호스트에 해당하는 사이트 규칙 목록 (없으면 빈 목록)."""
+        host = urlparse(url).netloc.lower()
+        for domain, rules in self.site_rules.items():
+            if host == domain or host.endswith("." + domain):
+                return rules
+        return []
+
+    def extract(self, content, url):
+        """
+        다운로드한 HTML에서 본문 텍스트를 추출합니다.
+
+        Args:
+            content (bytes): 기사 HTML.
+            url (str): 기사 URL (사이트 규칙 선택 및 오류 메시지용).
+
+        Returns:
+            str: 추출된 텍스트 콘텐츠 또는 안내 메시지.
+        """
+        text = ""
+        for rule in self.rules_for(url):
+            # 본문 컨테이너만 파싱 (나머지 문서는 트리로 만들지 않음)
+            subtree = BeautifulSoup(content, self.parser, parse_only=_strainer(rule))
+            if not rule.get('all'):
+                # 일반 규칙의 find()처럼 첫 번째 일치 요소만 사용
+                subtree = subtree.find(True, recursive=False)
+                if subtree is None:
+                    continue
+            text = self._render(subtree)
+            if text:
+                break
+
+        if not text:
+            text = self._extract_generic(content)
+
+        if not text and "news.google.com" in url:
+            return GOOGLE_NEWS_BLOCKED
+
+        return text if text else EXTRACTION_FAILED
+
+    def _extract_generic(self, content):
+        soup = BeautifulSoup(content, self.parser)
+
+        # 스크립트 및 스타일 제거
+        for tag in soup(NOISE_TAGS):
+            tag.decompose()
+
+        # 우선순위가 높은 규칙을 찾으면 나머지 문서 검색은 하지 않음
+        for rule in GENERIC_RULES:
+            if rule.get('all'):
+                found = soup.find_all(rule.get('tag'), attrs=rule.get('attrs', {}))
+                if found:
+                    target = soup.new_tag('div')
+                    for element in found:
+                        target.append(element)
+                    return self._render_element(target)
+            else:
+                found = soup.find(rule.get('tag'), attrs=rule.get('attrs', {}))
+                if found:
+                    return self._render_element(found)
+
+        # 모든 p 태그로 폴백
+        paragraphs = []
+        for p in soup.find_all('p'):
+            txt = p.get_text().strip()
+            if len(txt) > 40:
+                paragraphs.append(txt)
+        return '\n\n'.join(paragraphs)
+
+    def _render(self, subtree):
+        """SoupStrainer로 파싱된 서브트리(일치한 요소들)를 텍스트로 변환합니다."""
+        for tag in subtree(NOISE_TAGS):
+            tag.decompose()
+        return self._render_element(subtree)
+
+    def _render_element(self, target):
+        """HTML 구조를 Markdown 스타일 텍스트로 변환합니다."""
+        # 코드 블록 처리 (<pre>)
+        for pre in target.find_all('pre'):
+            pre.string = f"\n```\n{pre.get_text()}\n```\n"
+
+        # 리스트 처리 (<ul>) - 간단한 근사치
+        for ul in target.find_all('ul'):
+            for li in ul.find_all('li'):
+                li.string = f"- {li.get_text()}"
+
+        # 제목 처리 (h1-h3)
+        for h in target.find_all(['h1', 'h2', 'h3']):
+            level = int(h.name[1])
+            h.string = f"\n{'#' * level} {h.get_text()}\n"
+
+        text = target.get_text(separator='\n\n')
+        return _NEWLINES.sub('\n\n', text).strip()
+
+
+# 프로세스 풀 워커에서 사용하는 추출기 (워커 프로세스당 하나)
+_WORKER_EXTRACTOR = None
+
+# 프로세스 전역 추출 풀 (모든 세션의 NewsFetcher가 공유)
+_PROCESS_POOL = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _init_worker(site_rules, parser):
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = ArticleExtractor(site_rules=site_rules, parser=parser)
+
+
+def _extract_in_worker(content, url):
+    return _WORKER_EXTRACTOR.extract(content, url)
+
+
+class ProcessPoolExtractor:
+    """
+    ArticleExtractor.extract()를 별도 프로세스에서 실행하는 래퍼.
+
+    파싱은 GIL을 잡고 있으므로 스레드에서 실행하면 Streamlit 스크립트 스레드와
+    render_news_list 프래그먼트가 멈칫합니다. 바이트를 넘기고 텍스트만 받아오므로
+    파싱이 여러 코어로 분산됩니다. 풀에 문제가 생기면 현재 프로세스에서 추출합니다.
+
+    속성:
+        extractor (ArticleExtractor): 워커 설정 및 폴백용 추출기.
+        workers (int): 워커 프로세스 수.
+        timeout (float): 추출 한 건의 최대 대기 시간(초).
+    """
+    def __init__(self, extractor, workers, timeout=30):
+        self.extractor = extractor
+        self.workers = workers
+        self.timeout = timeout
+
+    @property
+    def parser(self):
+        return self.extractor.parser
+
+    def _get_pool(self):
+        global _PROCESS_POOL
+        with _PROCESS_POOL_LOCK:
+            if _PROCESS_POOL is None:
+                # Streamlit은 여러 스레드를 사용하므로 fork 대신 spawn으로 워커 생성
+                _PROCESS_POOL = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.extractor.site_rules, self.extractor.parser),
+                )
+            return _PROCESS_POOL
+
+    def _reset_pool(self):
+        global _PROCESS_POOL
+        with _PROCESS_POOL_LOCK:
+            if _PROCESS_POOL is not None:
+                _PROCESS_POOL.shutdown(wait=False)
+                _PROCESS_POOL = None
+
+    def extract(self, content, url):
+        try:
+            future = self._get_pool().submit(_extract_in_worker, content, url)
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool as e:
+            logger.error(f"Extraction pool broken, recreating: {e}")
+            self._reset_pool()
+        except Exception as e:
+            logger.error(f"Process extraction error: {e}")
+        return self.extractor.extract(content, url)
@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# config.json의 "http" 섹션 기본값
+DEFAULT_HTTP_CONFIG = {
+    "pool_connections": 10,   # 호스트별 커넥션 풀 개수
+    "pool_maxsize": 20,       # 풀당 유지할 최대 keep-alive 연결 수
+    "retries": 2,             # 연결 실패/일시적 오류 재시도 횟수
+    "backoff_factor": 0.3,    # 재시도 간 지수 백오프 계수
+    "status_forcelist": [429, 502, 503, 504],
+}
+
+_SESSION = None
+_DIRECT_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _load_http_config(config_file):
+    settings = dict(DEFAULT_HTTP_CONFIG)
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, 'r') as f:
+                settings.update(json.load(f).get('http', {}))
+        except Exception as e:
+            logger.error(f"Error loading http config: {e}")
+    return settings
+
+
+def build_session(settings):
+    """
+    호스트별 커넥션 풀과 재시도 정책이 적용된 requests.Session을 만듭니다.
+
+    상태 코드 기반 재시도는 GET/HEAD에만 적용되며, POST(LLM 호출)는 연결 단계의
+    실패만 재시도하므로 같은 생성 요청이 두 번 실행되지 않습니다.
+    """
+    retry = Retry(
+        total=settings['retries'],
+        connect=settings['retries'],
+        read=settings['retries'],
+        status=settings['retries'],
+        backoff_factor=settings['backoff_factor'],
+        status_forcelist=settings['status_forcelist'],
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings['pool_connections'],
+        pool_maxsize=settings['pool_maxsize'],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(config_file='config.json', retries=True):
+    """
+    NewsFetcher와 LLMManager가 공유하는 프로세스 전역 keep-alive 세션을 반환합니다.
+
+    retries=False이면 같은 풀 설정에 재시도만 끈 세션을 반환합니다. 서킷 브레이커가
+    감싸는 호출과 LLM 상태 확인/모델 목록 조회는 이 세션을 써야 urllib3 내부 재시도로
+    실패 감지가 늦어지지 않습니다.
+    """
+    global _SESSION, _DIRECT_SESSION
+    if retries:
+        if _SESSION is None:
+            with _SESSION_LOCK:
+                if _SESSION is None:
+                    _SESSION = build_session(_load_http_config(config_file))
+        return _SESSION
+    if _DIRECT_SESSION is None:
+        with _SESSION_LOCK:
+            if _DIRECT_SESSION is None:
+                _DIRECT_SESSION = build_session(dict(_load_http_config(config_file), retries=0))
+    return _DIRECT_SESSION
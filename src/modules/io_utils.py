@@ -0,0 +1,22 @@
+import json
+import os
+import tempfile
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """
+    JSON 파일을 원자적으로 씁니다 (같은 디렉터리의 임시 파일 + os.replace).
+
+    쓰는 도중 프로세스가 종료되거나 다른 스레드/프로세스가 읽어도 반쯤 쓰인
+    파일이 보이지 않습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -1,17 +1,111 @@
-import requests
+import contextlib
+from urllib.parse import urlparse
 import logging
 import json
 import os
 import subprocess
-from modules.metrics_manager import DataUsageTracker
+import threading
+import time
+from modules.metrics_manager import DataUsageTracker, LATENCY
+from modules import http_client
+from modules.llm_router import ROUTER
+from modules.circuit_breaker import CircuitOpenError, get_breakers
+from modules.io_utils import atomic_write_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# NEWS_READER_LLM_CONFIG overrides the location (used by the benchmark suite)
+CONFIG_PATH = os.environ.get(
+    "NEWS_READER_LLM_CONFIG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "llm_config.json")
+)
+CONFIG_CHECK_INTERVAL = 1.0  # seconds between mtime checks
+LOCAL_TIMEOUT = 120  # upper bound for self-hosted providers; breakers adapt below it
+CLOUD_TIMEOUT = 60
+
+
+class _ConfigCache:
+    """
+    Process-wide cache of llm_config.json.
+
+    The file is parsed once and re-read only when its mtime changes (checked
+    at most every CONFIG_CHECK_INTERVAL seconds), so lookups on the
+    summarization hot path are a dict access. Writes are atomic and replace
+    the cached dict instead of mutating it.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = {}
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def _mtime_of(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self):
+        now = time.monotonic()
+        if now - self._checked_at < CONFIG_CHECK_INTERVAL:
+            return self._data
+        with self._lock:
+            self._checked_at = now
+            mtime = self._mtime_of()
+            if mtime != self._mtime:
+                self._data = self._read()
+                self._mtime = mtime
+            return self._data
+
+    def _read(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading config: {e}")
+        return {}
+
+    def update(self, key, value):
+        with self._lock:
+            # Start from the file's current contents in case it was edited by hand
+            data = dict(self._read() if self._mtime_of() != self._mtime else self._data)
+            data[key] = value
+            try:
+                atomic_write_json(self.path, data, indent=4)
+            except Exception as e:
+                logger.error(f"Error saving config: {e}")
+                return
+            self._data = data
+            self._mtime = self._mtime_of()
+            self._checked_at = time.monotonic()
+
+
+_CONFIG = _ConfigCache(CONFIG_PATH)
+
+class StreamError(str):
+    """
+    Error chunk yielded by stream_response().
+
+    Still a plain string for st.write_stream() and "".join(), but lets callers
+    tell a failed (possibly truncated) stream apart from a complete answer.
+    """
+
+
+# Process-wide request slots per provider (or per routing pool): key -> (limit, semaphore)
+_SLOTS_LOCK = threading.Lock()
+_SLOTS = {}
+
+
 class LLMManager:
     def __init__(self):
         self.ssh_key_path = os.path.expanduser('~/.ssh/id_ed25519')
         self.ssh_host = 'ross@192.168.1.238'
+        # Provider that served the last call on this thread (differs from
+        # selected_provider when routing.mode is "balanced")
+        self._local = threading.local()
         
         # Load Config & Providers
         self.config = self.get_config()
@@ -38,24 +132,11 @@ class LLMManager:
         self.providers = list(self.provider_map.keys()) + self.cloud_providers
 
     def get_config(self):
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "llm_config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading config: {e}")
-        return {}
+        """Returns the cached llm_config.json contents (treat as read-only)."""
+        return _CONFIG.get()
 
     def update_config(self, key, value):
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "llm_config.json")
-        try:
-            data = self.get_config()
-            data[key] = value
-            with open(config_path, "w") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            logger.error(f"Error saving config: {e}")
+        _CONFIG.update(key, value)
 
     def set_provider(self, provider):
         """Sets the current LLM provider."""
@@ -68,10 +149,11 @@ class LLMManager:
 
     @property
     def current_host_label(self):
-        if self.selected_provider in self.provider_map:
-            p = self.provider_map[self.selected_provider]
+        provider = getattr(self._local, 'provider', None) or self.selected_provider
+        if provider in self.provider_map:
+            p = self.provider_map[provider]
             return p.get('display_name', f"{p['name']} ({p['url']})")
-        return f"Cloud API ({self.selected_provider})"
+        return f"Cloud API ({provider})"
 
     def get_context_default_model(self):
         """Returns default model for current provider."""
@@ -86,6 +168,109 @@ class LLMManager:
         key = f"default_model_{self.selected_provider}"
         self.update_config(key, model_name)
 
+    def get_concurrency(self):
+        """
+        Returns how many requests may run in parallel against the current provider.
+
+        Custom providers can set "max_concurrency"; otherwise the
+        "llm_concurrency" map in llm_config.json is used (local hosts default
+        to 1 so a single GPU box is not oversubscribed).
+        When requests are balanced across the routing pool this is the sum
+        over the pool.
+        """
+        if self.is_balanced():
+            return sum(self._provider_concurrency(p['name']) for p in self._routing_pool())
+        return self._provider_concurrency(self.selected_provider)
+
+    def _provider_concurrency(self, provider):
+        if provider in self.provider_map:
+            p = self.provider_map[provider]
+            if 'max_concurrency' in p:
+                return max(1, int(p['max_concurrency']))
+            default = 1
+        else:
+            default = 4
+        limits = self.get_config().get("llm_concurrency", {})
+        return max(1, int(limits.get(provider, default)))
+
+    def request_slot(self):
+        """
+        Returns the process-wide semaphore that caps concurrent requests to the
+        current provider (or the balanced pool) at get_concurrency().
+
+        generate_response() and stream_response() hold a slot for the duration
+        of each call, so the summary pipeline, map-reduce chunk calls and the UI
+        all share one limit instead of multiplying their own.
+        """
+        key = "balanced" if self.is_balanced() else self.selected_provider
+        limit = self.get_concurrency()
+        with _SLOTS_LOCK:
+            entry = _SLOTS.get(key)
+            if entry is None or entry[0] != limit:
+                # Limit changed in llm_config.json; callers holding the old one release it as usual
+                entry = _SLOTS[key] = (limit, threading.BoundedSemaphore(limit))
+        return entry[1]
+
+    def get_routing(self):
+        """Returns the "routing" section of llm_config.json (mode "single" when absent)."""
+        return self.get_config().get("routing", {})
+
+    def _routing_pool(self):
+        names = self.get_routing().get("pool") or list(self.provider_map)
+        return [self.provider_map[n] for n in names if n in self.provider_map]
+
+    def is_balanced(self):
+        """
+        True when routing.mode is "balanced" and selected_provider is one of the
+        pool hosts. Picking a cloud provider (or a host outside the pool) in the
+        sidebar sends requests to that provider only, as in "single" mode.
+        """
+        if self.get_routing().get("mode") != "balanced":
+            return False
+        return any(p['name'] == self.selected_provider for p in self._routing_pool())
+
+    def _route(self, model):
+        """
+        Returns the provider names to try for one call, best first.
+
+        In "balanced" mode the custom providers in routing.pool (all of them by
+        default) are ranked by ProviderRouter on observed latency and in-flight
+        requests, and up to routing.max_failovers further hosts are tried when
+        one fails. Otherwise (including when selected_provider is not in the
+        pool) only selected_provider is used.
+        """
+        if not self.is_balanced():
+            return [self.selected_provider]
+        routing = self.get_routing()
+        ROUTER.configure(self._routing_pool(), routing.get("probe_interval"), routing.get("ewma_alpha"))
+        order = ROUTER.order(model) or [self.selected_provider]
+        return order[:1 + int(routing.get("max_failovers", 2))]
+
+    def _breaker(self, provider):
+        """Circuit breaker shared by every provider on the same host."""
+        if provider in self.provider_map:
+            return get_breakers().get(urlparse(self.provider_map[provider]['url']).netloc)
+        return get_breakers().get(provider)
+
+    def _timeout(self, provider, breaker, kind="response"):
+        """
+        (connect, read) timeout for requests.
+
+        Connecting is fixed and short, so a dead host fails in seconds. Only the
+        read timeout adapts to the breaker's p95; warm samples (e.g. 0.3s TTFT)
+        say nothing about a cold model load, so it keeps a much higher floor
+        than article downloads.
+        """
+        default = LOCAL_TIMEOUT if provider in self.provider_map else CLOUD_TIMEOUT
+        read = breaker.timeout(default, kind, min_timeout=breaker.settings['llm_min_timeout'])
+        return (breaker.settings['llm_connect_timeout'], read)
+
+    def _track(self, provider):
+        """Feeds latency/failures of custom providers into the router."""
+        if provider in self.provider_map:
+            return ROUTER.track(provider)
+        return contextlib.nullcontext()
+
     def check_connection(self):
         """Checks connection to current provider."""
         if self.selected_provider in self.provider_map:
@@ -95,19 +280,13 @@ class LLMManager:
             
             try:
                 if p_type == 'ollama':
-                    resp = requests.get(f"{url}/api/tags", timeout=2)
+                    resp = http_client.get_session(retries=False).get(f"{url}/api/tags", timeout=2)
                     if resp.status_code == 200:
                         return True, f"Connected to {p['name']}"
                     return False, f"Status: {resp.status_code}"
                 elif p_type == 'openai':
-                    # Check models endpoint for OpenAI compatible
-                    resp = requests.get(f"{url}/models", timeout=2) # Often no /v1 prefix needed if base has it, or /v1/models
-                    # Wait, config url has /v1 usually for OpenAI compatible.
-                    # Standard is GET /v1/models
-                    # If config url is .../v1, then just /models might work? 
-                    # Let's try appending /models if it doesn't end with it.
-                    target = f"{url}/models"
-                    resp = requests.get(target, timeout=2)
+                    # Check models endpoint for OpenAI compatible (config url usually ends with /v1)
+                    resp = http_client.get_session(retries=False).get(f"{url}/models", timeout=2)
                     if resp.status_code == 200:
                         return True, f"Connected to {p['name']}"
                     return False, f"Status: {resp.status_code}"
@@ -131,11 +310,11 @@ class LLMManager:
             
             try:
                 if p_type == 'ollama':
-                    resp = requests.get(f"{url}/api/tags", timeout=5)
+                    resp = http_client.get_session(retries=False).get(f"{url}/api/tags", timeout=5)
                     if resp.status_code == 200:
                         return [m['name'] for m in resp.json().get('models', [])]
                 elif p_type == 'openai':
-                    resp = requests.get(f"{url}/models", timeout=5)
+                    resp = http_client.get_session(retries=False).get(f"{url}/models", timeout=5)
                     if resp.status_code == 200:
                         data = resp.json()
                         # OpenAI format: { data: [ {id: ...}, ... ] }
@@ -156,61 +335,199 @@ class LLMManager:
         return []
 
     def generate_response(self, prompt, model, stream=False):
-        """Generates response based on selected provider."""
-        tracker = DataUsageTracker()
-        
-        try:
-            if self.selected_provider in self.provider_map:
-                p = self.provider_map[self.selected_provider]
-                if p.get('type') == 'openai':
-                     return self._call_openai_compatible(prompt, model, stream, tracker, p['url'])
-                else:
-                     # Default to ollama
-                     return self._call_ollama(prompt, model, stream, tracker, p['url'])
-
-            elif self.selected_provider == "openai":
-                return self._call_openai(prompt, model, stream, tracker)
-            elif self.selected_provider == "gemini":
-                # For stability, use non-streaming for now unless requested otherwise
-                return self._call_gemini(prompt, model, stream, tracker)
-        except Exception as e:
-            logger.error(f"Generate Error ({self.selected_provider}): {e}")
-            return f"Error: {e}"
-        
-        return "Error: Unknown Provider"
+        """Generates response based on selected provider (or the routing pool)."""
+        if stream:
+            return "".join(self.stream_response(prompt, model))
+
+        with self.request_slot():
+            return self._generate_routed(prompt, model)
+
+    def _generate_routed(self, prompt, model):
+        error = None
+        for provider in self._route(model):
+            breaker = self._breaker(provider)
+            try:
+                breaker.before_call()
+            except CircuitOpenError as e:
+                # Fail fast (or move on to the next pool host) instead of waiting for a timeout
+                error = e
+                continue
+            self._local.provider = provider
+            tracker = DataUsageTracker(provider=provider)
+            start = time.perf_counter()
+            try:
+                with LATENCY.timed("llm_call", provider=provider, model=model), self._track(provider):
+                    text = self._call_provider(provider, prompt, model, tracker, self._timeout(provider, breaker))
+            except Exception as e:
+                breaker.record_failure(e)
+                logger.error(f"Generate Error ({provider}): {e}")
+                error = e
+                continue
+            breaker.record_success(time.perf_counter() - start)
+            return text
+        return f"Error: {error}"
+
+    def _call_provider(self, provider, prompt, model, tracker, timeout):
+        if provider in self.provider_map:
+            p = self.provider_map[provider]
+            if p.get('type') == 'openai':
+                 return self._call_openai_compatible(prompt, model, False, tracker, p['url'], timeout)
+            else:
+                 # Default to ollama
+                 return self._call_ollama(prompt, model, False, tracker, p['url'], timeout)
+
+        elif provider == "openai":
+            return self._call_openai(prompt, model, False, tracker, timeout)
+        elif provider == "gemini":
+            # For stability, use non-streaming for now unless requested otherwise
+            return self._call_gemini(prompt, model, False, tracker, timeout)
+        raise ValueError("Unknown Provider")
+
+    def stream_response(self, prompt, model):
+        """
+        Yields the response text chunk by chunk as the provider generates it.
+
+        Works for Ollama, OpenAI-compatible hosts, OpenAI and Gemini. Errors are
+        logged and yielded as a final "Error: ..." StreamError chunk, matching
+        generate_response(). With balanced routing, a host that fails before
+        its first chunk is skipped for the next one in the pool.
+        """
+        with self.request_slot():
+            yield from self._stream_routed(prompt, model)
+
+    def _stream_routed(self, prompt, model):
+        error = None
+        for provider in self._route(model):
+            breaker = self._breaker(provider)
+            try:
+                breaker.before_call()
+            except CircuitOpenError as e:
+                error = e
+                continue
+            self._local.provider = provider
+            tracker = DataUsageTracker(provider=provider)
+            started = False
+            try:
+                with self._track(provider):
+                    start = time.perf_counter()
+                    timeout = self._timeout(provider, breaker, kind="stream")
+                    for chunk in self._open_stream(provider, prompt, model, tracker, timeout):
+                        if not started:
+                            ttft = time.perf_counter() - start
+                            LATENCY.observe("llm_ttft", ttft, provider=provider, model=model)
+                            # The read timeout bounds the wait for the first chunk, so adapt it to TTFT
+                            breaker.record_success(ttft, kind="stream")
+                            started = True
+                        yield chunk
+                    LATENCY.observe("llm_call", time.perf_counter() - start, provider=provider, model=model)
+                return
+            except Exception as e:
+                breaker.record_failure(e)
+                logger.error(f"Stream Error ({provider}): {e}")
+                if started:
+                    # Part of the answer is already out; cannot switch hosts
+                    yield StreamError(f"\nError: {e}")
+                    return
+                error = e
+        yield StreamError(f"Error: {error}")
+
+    def _open_stream(self, provider, prompt, model, tracker, timeout):
+        if provider in self.provider_map:
+            p = self.provider_map[provider]
+            if p.get('type') == 'openai':
+                # Some local servers might need a dummy key
+                return self._stream_openai_compatible(
+                    prompt, model, tracker, f"{p['url']}/chat/completions", "local-key", timeout=timeout
+                )
+            return self._stream_ollama(prompt, model, tracker, p['url'], timeout)
 
-    def _call_ollama(self, prompt, model, stream, tracker, base_url):
+        elif provider == "openai":
+            api_key = self.get_config().get("api_keys", {}).get("openai")
+            if not api_key: raise ValueError("OpenAI API Key missing")
+            return self._stream_openai_compatible(
+                prompt, model, tracker, "https://api.openai.com/v1/chat/completions", api_key, timeout=timeout
+            )
+        elif provider == "gemini":
+            return self._stream_gemini(prompt, model, tracker, timeout)
+        raise ValueError("Unknown Provider")
+
+    def _iter_json_lines(self, response, tracker, sse=False):
+        """Parses a streamed body of JSON lines (Ollama) or SSE "data:" lines."""
+        for line in response.iter_lines():
+            if not line:
+                continue
+            tracker.add_rx(len(line))
+            line = line.decode("utf-8")
+            if sse:
+                if not line.startswith("data:"):
+                    continue
+                line = line[len("data:"):].strip()
+                if line == "[DONE]":
+                    return
+            yield json.loads(line)
+
+    def _stream_ollama(self, prompt, model, tracker, base_url, timeout=LOCAL_TIMEOUT):
+        payload = {"model": model, "prompt": prompt, "stream": True, "context": []}
+        tracker.add_tx(len(json.dumps(payload)))
+
+        with http_client.get_session(retries=False).post(f"{base_url}/api/generate", json=payload, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for body in self._iter_json_lines(response, tracker):
+                if body.get("response"):
+                    yield body["response"]
+                if body.get("done"):
+                    return
+
+    def _stream_openai_compatible(self, prompt, model, tracker, url, api_key, timeout):
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        messages = [{"role": "user", "content": prompt}]
+        payload = {"model": model, "messages": messages, "stream": True}
+        tracker.add_tx(len(json.dumps(payload)))
+
+        with http_client.get_session(retries=False).post(url, headers=headers, json=payload, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for body in self._iter_json_lines(response, tracker, sse=True):
+                choices = body.get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+
+    def _stream_gemini(self, prompt, model, tracker, timeout=CLOUD_TIMEOUT):
+        api_key = self.get_config().get("api_keys", {}).get("gemini")
+        if not api_key: raise ValueError("Gemini API Key missing")
+
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
+        headers = {"Content-Type": "application/json"}
+        payload = {"contents": [{"parts": [{"text": prompt}]}]}
+        tracker.add_tx(len(json.dumps(payload)))
+
+        with http_client.get_session(retries=False).post(url, headers=headers, json=payload, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for body in self._iter_json_lines(response, tracker, sse=True):
+                try:
+                    text = body['candidates'][0]['content']['parts'][0]['text']
+                except (KeyError, IndexError):
+                    continue
+                if text:
+                    yield text
+
+    def _call_ollama(self, prompt, model, stream, tracker, base_url, timeout=LOCAL_TIMEOUT):
         payload = {
             "model": model,
             "prompt": prompt,
-            "stream": stream,
+            "stream": False,  # streaming goes through stream_response()
             "context": [] # Stateless
         }
         tracker.add_tx(len(json.dumps(payload)))
         
-        response = requests.post(f"{base_url}/api/generate", json=payload, stream=stream, timeout=120)
+        response = http_client.get_session(retries=False).post(f"{base_url}/api/generate", json=payload, timeout=timeout)
         response.raise_for_status()
         
-        if stream:
-             tracker.add_rx(len(response.content)) # Approx
-             # See notes below regarding stream
-             pass
-        
-        # Non-streaming handling (or aggregating stream)
-        # If stream=True was passed but we digest it here:
-        full_text = ""
-        if stream:
-             for line in response.iter_lines():
-                 if line:
-                     body = json.loads(line)
-                     full_text += body.get("response", "")
-        else:
-             full_text = response.json().get("response", "")
-             
+        full_text = response.json().get("response", "")
         tracker.add_rx(len(full_text))
         return full_text
 
-    def _call_openai_compatible(self, prompt, model, stream, tracker, base_url):
+    def _call_openai_compatible(self, prompt, model, stream, tracker, base_url, timeout=LOCAL_TIMEOUT):
         """Calls an OpenAI-compatible endpoint (like LM Studio)."""
         url = f"{base_url}/chat/completions"
         headers = {"Content-Type": "application/json"}
@@ -221,7 +538,7 @@ class LLMManager:
         payload = {"model": model, "messages": messages, "stream": False} # Force False
         
         tracker.add_tx(len(json.dumps(payload)))
-        r = requests.post(url, headers=headers, json=payload, timeout=120)
+        r = http_client.get_session(retries=False).post(url, headers=headers, json=payload, timeout=timeout)
         r.raise_for_status()
         
         res = r.json()
@@ -229,7 +546,7 @@ class LLMManager:
         tracker.add_rx(len(r.content))
         return text
 
-    def _call_openai(self, prompt, model, stream, tracker):
+    def _call_openai(self, prompt, model, stream, tracker, timeout=CLOUD_TIMEOUT):
         api_key = self.get_config().get("api_keys", {}).get("openai")
         if not api_key: raise ValueError("OpenAI API Key missing")
         
@@ -239,7 +556,7 @@ class LLMManager:
         payload = {"model": model, "messages": messages, "stream": False} # Force False for now
         
         tracker.add_tx(len(json.dumps(payload)))
-        r = requests.post(url, headers=headers, json=payload, timeout=60)
+        r = http_client.get_session(retries=False).post(url, headers=headers, json=payload, timeout=timeout)
         r.raise_for_status()
         
         res = r.json()
@@ -247,7 +564,7 @@ class LLMManager:
         tracker.add_rx(len(r.content))
         return text
 
-    def _call_gemini(self, prompt, model, stream, tracker):
+    def _call_gemini(self, prompt, model, stream, tracker, timeout=CLOUD_TIMEOUT):
         api_key = self.get_config().get("api_keys", {}).get("gemini")
         if not api_key: raise ValueError("Gemini API Key missing")
         
@@ -256,7 +573,7 @@ class LLMManager:
         payload = {"contents": [{"parts": [{"text": prompt}]}]}
         
         tracker.add_tx(len(json.dumps(payload)))
-        r = requests.post(url, headers=headers, json=payload, timeout=60)
+        r = http_client.get_session(retries=False).post(url, headers=headers, json=payload, timeout=timeout)
         r.raise_for_status()
         
         data = r.json()
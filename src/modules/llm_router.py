@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from modules import http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_INTERVAL = 30.0  # seconds between background health probes
+DEFAULT_EWMA_ALPHA = 0.3
+PROBE_TIMEOUT = 2
+
+
+def list_models(provider, timeout=PROBE_TIMEOUT):
+    """
+    Returns the model names a custom provider serves.
+
+    Raises on connection errors and non-200 responses so callers can treat
+    the host as unhealthy.
+    """
+    url = provider['url']
+    if provider.get('type', 'ollama') == 'openai':
+        resp = http_client.get_session(retries=False).get(f"{url}/models", timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        if 'data' in data:
+            return [m['id'] for m in data['data']]
+        return [str(m) for m in data]
+    resp = http_client.get_session(retries=False).get(f"{url}/api/tags", timeout=timeout)
+    resp.raise_for_status()
+    return [m['name'] for m in resp.json().get('models', [])]
+
+
+def _serves(models, model):
+    """Ollama lists "name:tag"; accept the bare name for ":latest"."""
+    if models is None:
+        return True  # not probed yet
+    return model in models or f"{model}:latest" in models
+
+
+class _HostState:
+    def __init__(self):
+        self.ewma = None  # seconds
+        self.in_flight = 0
+        self.healthy = True
+        self.models = None
+        self.failures = 0
+        self.last_error = None
+
+
+class ProviderRouter:
+    """
+    Process-wide latency-aware router across custom LLM providers.
+
+    Each host keeps an EWMA of observed call latency and an in-flight count.
+    order() ranks the healthy hosts serving a model by
+    ewma * (in_flight + 1), so idle fast hosts win and busy ones shed load;
+    hosts with no samples yet are tried first. A failed call marks the host
+    unhealthy until the background probe (GET /api/tags or /models) sees it
+    answer again.
+    """
+    def __init__(self, probe_interval=DEFAULT_PROBE_INTERVAL, alpha=DEFAULT_EWMA_ALPHA):
+        self.probe_interval = probe_interval
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self._providers = {}
+        self._probe_thread = None
+
+    def _state(self, name):
+        state = self._hosts.get(name)
+        if state is None:
+            state = self._hosts[name] = _HostState()
+        return state
+
+    def configure(self, providers, probe_interval=None, alpha=None):
+        """Sets the pool (list of provider dicts) and starts the probe thread once."""
+        with self._lock:
+            self._providers = {p['name']: p for p in providers}
+            if probe_interval:
+                self.probe_interval = float(probe_interval)
+            if alpha:
+                self.alpha = float(alpha)
+            if self._probe_thread is None and self._providers:
+                self._probe_thread = threading.Thread(target=self._probe_loop, name="llm-probe", daemon=True)
+                self._probe_thread.start()
+
+    def order(self, model):
+        """Returns provider names that can serve model, best first (unhealthy ones last)."""
+        with self._lock:
+            ranked = []
+            for name in self._providers:
+                state = self._state(name)
+                if not _serves(state.models, model):
+                    continue
+                load = (state.ewma or 0.0) * (state.in_flight + 1)
+                ranked.append((not state.healthy, load, state.in_flight, name))
+            ranked.sort()
+            return [name for *_, name in ranked]
+
+    @contextmanager
+    def track(self, name):
+        """Counts a call as in flight and records its latency or failure."""
+        with self._lock:
+            self._state(name).in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(name, e)
+            raise
+        else:
+            self.record_success(name, time.perf_counter() - start)
+        finally:
+            with self._lock:
+                self._state(name).in_flight -= 1
+
+    def record_success(self, name, seconds):
+        with self._lock:
+            state = self._state(name)
+            state.ewma = seconds if state.ewma is None else self.alpha * seconds + (1 - self.alpha) * state.ewma
+            state.healthy = True
+            state.failures = 0
+
+    def record_failure(self, name, error):
+        with self._lock:
+            state = self._state(name)
+            state.healthy = False
+            state.failures += 1
+            state.last_error = str(error)
+        logger.warning(f"LLM host {name} marked unhealthy: {error}")
+
+    def probe(self):
+        """Checks every pool host once and refreshes its health and model list."""
+        with self._lock:
+            providers = list(self._providers.values())
+        for provider in providers:
+            try:
+                models = list_models(provider)
+            except Exception as e:
+                with self._lock:
+                    state = self._state(provider['name'])
+                    state.healthy = False
+                    state.last_error = str(e)
+                continue
+            with self._lock:
+                state = self._state(provider['name'])
+                state.healthy = True
+                state.models = set(models)
+
+    def _probe_loop(self):
+        while True:
+            try:
+                self.probe()
+            except Exception as e:
+                logger.error(f"LLM probe error: {e}")
+            time.sleep(self.probe_interval)
+
+    def snapshot(self):
+        """Per-host state for display: name, healthy, ewma_ms, in_flight, failures."""
+        with self._lock:
+            return [
+                {
+                    'name': name,
+                    'healthy': state.healthy,
+                    'ewma_ms': round(state.ewma * 1000, 1) if state.ewma is not None else None,
+                    'in_flight': state.in_flight,
+                    'failures': state.failures,
+                }
+                for name, state in ((n, self._state(n)) for n in self._providers)
+            ]
+
+
+ROUTER = ProviderRouter()
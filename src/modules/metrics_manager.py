@@ -1,67 +1,315 @@
-import streamlit as st
+import atexit
 import json
+import logging
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
+from modules.io_utils import atomic_write_json
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: 파일 잠금 없이 기록 (여러 프로세스가 동시에 쓰면 일부 증분이 유실될 수 있음)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
 DATA_USAGE_FILE = "data_usage.json"
+FLUSH_INTERVAL = 10    # 디스크에 기록하는 주기(초)
+KEEP_DAYS = 90         # 파일에 보관할 일별 기록 수
 
-class DataUsageTracker:
-    def __init__(self):
-        # 세션 상태 키가 없으면 초기화
-        if 'data_usage_rx' not in st.session_state:
-            st.session_state.data_usage_rx = 0
-        if 'data_usage_tx' not in st.session_state:
-            st.session_state.data_usage_tx = 0
-            
-    def _load_data(self):
-        if os.path.exists(DATA_USAGE_FILE):
+
+def _today():
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _new_day():
+    return {'rx': 0, 'tx': 0, 'sources': {}, 'providers': {}}
+
+
+def _merge_days(days, deltas):
+    """deltas의 일별 증분을 days에 더합니다 (days를 직접 수정)."""
+    for date, delta in deltas.items():
+        day = days.setdefault(date, _new_day())
+        for direction in ('rx', 'tx'):
+            day[direction] = day.get(direction, 0) + delta[direction]
+        for group in ('sources', 'providers'):
+            counters = day.setdefault(group, {})
+            for name, counts in delta[group].items():
+                target = counters.setdefault(name, {'rx': 0, 'tx': 0})
+                for direction in ('rx', 'tx'):
+                    target[direction] = target.get(direction, 0) + counts[direction]
+    return days
+
+
+@contextmanager
+def _file_lock(path):
+    """path 옆의 잠금 파일(path + '.lock')에 대한 프로세스 간 배타 잠금."""
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class _UsageStore:
+    """
+    프로세스 전역 사용량 누적기.
+
+    add()는 잠금 아래에서 메모리 카운터만 갱신하며, 파일 기록은 백그라운드
+    스레드가 FLUSH_INTERVAL마다(그리고 종료 시) 원자적으로 수행합니다.
+    여러 프로세스(예: Streamlit 워커, 벤치마크)가 같은 파일을 쓰므로 flush()는
+    마지막 기록 이후의 증분만 보관했다가 잠금 파일을 잡고 파일을 다시 읽어 더합니다.
+    _days는 파일의 합계에 아직 기록하지 않은 증분을 더한 값입니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._days = None
+        self._pending = {}  # 마지막 flush 이후의 일별 증분
+        self._flusher = None
+
+    def _load(self):
+        days = {}
+        if os.path.exists(self.path):
             try:
-                with open(DATA_USAGE_FILE, 'r') as f:
+                with open(self.path, 'r') as f:
                     data = json.load(f)
-                    # 날짜가 오늘인지 확인
-                    if data.get('date') == datetime.now().strftime('%Y-%m-%d'):
-                        return data
-            except:
-                pass
-        return {'date': datetime.now().strftime('%Y-%m-%d'), 'rx': 0, 'tx': 0}
-
-    def _save_data(self, data):
+                if 'days' in data:
+                    days = data['days']
+                elif 'date' in data:
+                    # 이전 형식: {'date', 'rx', 'tx'}
+                    day = _new_day()
+                    day['rx'] = data.get('rx', 0)
+                    day['tx'] = data.get('tx', 0)
+                    days[data['date']] = day
+            except Exception as e:
+                logger.error(f"Error loading data usage: {e}")
+        return days
+
+    def _ensure_started(self):
+        # 잠금을 잡은 상태에서 호출됨
+        if self._days is None:
+            self._days = self._load()
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="data-usage-flush", daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+    def add(self, direction, bytes_count, source=None, provider=None):
+        with self._lock:
+            self._ensure_started()
+            today = _today()
+            for day in (self._days.setdefault(today, _new_day()), self._pending.setdefault(today, _new_day())):
+                day[direction] += bytes_count
+                if source:
+                    day['sources'].setdefault(source, {'rx': 0, 'tx': 0})[direction] += bytes_count
+                if provider:
+                    day['providers'].setdefault(provider, {'rx': 0, 'tx': 0})[direction] += bytes_count
+
+    def snapshot(self, date):
+        with self._lock:
+            if self._days is None:
+                self._days = self._load()
+            day = self._days.get(date, _new_day())
+            return json.loads(json.dumps(day))
+
+    def flush(self):
+        """
+        증분을 파일의 합계에 더해 기록하고, 다른 프로세스의 기록까지 합친 합계로
+        _days를 갱신합니다. 기록할 증분이 없어도 파일을 다시 읽어 합계를 갱신합니다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
         try:
-            with open(DATA_USAGE_FILE, 'w') as f:
-                json.dump(data, f)
-        except:
-            pass
+            with _file_lock(self.path):
+                days = self._load()
+                if pending:
+                    _merge_days(days, pending)
+                    for old in sorted(days)[:-KEEP_DAYS]:
+                        del days[old]
+                    atomic_write_json(self.path, {'days': days})
+        except Exception as e:
+            logger.error(f"Error saving data usage: {e}")
+            with self._lock:
+                # 기록하지 못한 증분은 다음 flush에서 다시 시도
+                _merge_days(self._pending, pending)
+            return
+        with self._lock:
+            # flush 도중 들어온 증분은 아직 파일에 없으므로 다시 더함
+            self._days = _merge_days(days, self._pending)
+
+
+_STORE = _UsageStore(DATA_USAGE_FILE)
+
+
+class DataUsageTracker:
+    """
+    송수신 바이트를 소스/제공자/일자별로 집계합니다.
+
+    모든 인스턴스가 프로세스 전역 누적기를 공유하므로 가볍게 생성할 수 있고,
+    st.session_state를 사용하지 않아 백그라운드 스레드에서도 안전합니다.
+
+    Args:
+        source (str): 이 추적기로 기록할 뉴스 소스 이름 (선택).
+        provider (str): 이 추적기로 기록할 LLM 제공자 이름 (선택).
+    """
+    def __init__(self, source=None, provider=None):
+        self.source = source
+        self.provider = provider
 
     def add_rx(self, bytes_count):
         """수신 바이트 추가"""
         if bytes_count:
-            # 세션 업데이트 (일시적)
-            st.session_state.data_usage_rx += bytes_count
-            
-            # 파일 업데이트 (영구적)
-            data = self._load_data()
-            data['rx'] += bytes_count
-            self._save_data(data)
+            _STORE.add('rx', bytes_count, self.source, self.provider)
 
     def add_tx(self, bytes_count):
         """송신 바이트 추가"""
         if bytes_count:
-            st.session_state.data_usage_tx += bytes_count
-            
-            # 파일 업데이트
-            data = self._load_data()
-            data['tx'] += bytes_count
-            self._save_data(data)
+            _STORE.add('tx', bytes_count, self.source, self.provider)
+
+    def flush(self):
+        """버퍼된 사용량을 즉시 파일에 기록합니다."""
+        _STORE.flush()
 
     def get_stats(self):
         """통계 가져오기 (오늘 전체)"""
-        # 이 세션뿐만 아니라 오늘의 전체 사용량을 표시하고 싶습니다.
-        data = self._load_data()
+        data = _STORE.snapshot(_today())
         rx_bytes = data['rx']
         tx_bytes = data['tx']
         
         return {
             "rx_bytes": rx_bytes,
             "tx_bytes": tx_bytes,
-            "total_bytes": rx_bytes + tx_bytes
+            "total_bytes": rx_bytes + tx_bytes,
+            "by_source": data['sources'],
+            "by_provider": data['providers']
         }
+
+
+# 단계별 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class LatencyHistogram:
+    """고정 버킷 히스토그램 (Prometheus histogram과 같은 누적 방식으로 출력)."""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q):
+        """버킷 안에서 선형 보간한 분위수 추정치 (초)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for i, bound in enumerate(self.buckets):
+            if cumulative + self.counts[i] >= target:
+                fraction = (target - cumulative) / self.counts[i] if self.counts[i] else 0
+                return lower + (bound - lower) * fraction
+            cumulative += self.counts[i]
+            lower = bound
+        return self.buckets[-1]
+
+
+class LatencyRegistry:
+    """
+    파이프라인 단계별 지연 시간 히스토그램 모음.
+
+    단계(stage)와 레이블(예: source, provider, model, method) 조합마다 히스토그램을
+    하나씩 유지합니다. 모든 스레드에서 기록할 수 있습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, stage, seconds, **labels):
+        key = (stage, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None)))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, stage, **labels):
+        """with 블록의 실행 시간을 stage에 기록합니다 (예외가 나도 기록)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def snapshot(self):
+        """사이드바 표시용 요약: stage, labels, count, p50, p95, mean (ms)."""
+        with self._lock:
+            rows = []
+            for (stage, labels), h in sorted(self._histograms.items()):
+                rows.append({
+                    'stage': stage,
+                    'labels': ", ".join(f"{k}={v}" for k, v in labels),
+                    'count': h.count,
+                    'p50_ms': round(h.quantile(0.5) * 1000, 1),
+                    'p95_ms': round(h.quantile(0.95) * 1000, 1),
+                    'mean_ms': round(h.sum / h.count * 1000, 1) if h.count else 0.0,
+                })
+            return rows
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식으로 모든 히스토그램을 출력합니다."""
+        name = "news_reader_stage_latency_seconds"
+        lines = [
+            f"# HELP {name} Latency of News Reader pipeline stages.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for (stage, labels), h in sorted(self._histograms.items()):
+                base = [f'stage="{_escape_label(stage)}"'] + [f'{k}="{_escape_label(v)}"' for k, v in labels]
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(base, le=bound)} {cumulative}")
+                lines.append(f"{name}_bucket{_labels(base, le='+Inf')} {h.count}")
+                lines.append(f"{name}_sum{_labels(base)} {h.sum:.6f}")
+                lines.append(f"{name}_count{_labels(base)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(base, le=None):
+    pairs = list(base)
+    if le is not None:
+        pairs.append(f'le="{le}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# 프로세스 전역 지연 시간 레지스트리
+LATENCY = LatencyRegistry()
@@ -1,17 +1,227 @@
 import feedparser
-from modules.llm_manager import LLMManager
-from modules.metrics_manager import DataUsageTracker
-import requests
+from modules.llm_manager import LLMManager, StreamError
+from modules.metrics_manager import DataUsageTracker, LATENCY
+from modules import http_client
+from modules.extractor import ArticleExtractor, EXTRACTION_FAILED, GOOGLE_NEWS_BLOCKED
+from modules.cache import TTLCache, MISSING
+from modules.singleflight import SingleFlight
+from modules import text_compressor
+from modules.circuit_breaker import get_breakers
 from bs4 import BeautifulSoup
 import mysql.connector
+from mysql.connector import pooling
+import functools
+import hashlib
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 커넥션 풀 (UI 스레드와 워커 스레드가 공유)
+_POOL_LOCK = threading.Lock()
+_POOLS = {}
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_POOL_TIMEOUT = 5  # 풀이 고갈되었을 때 대기할 최대 시간(초)
+
+# tb_summary_cache 앞단의 메모리 캐시 기본값 (config.json의 summary_cache로 변경 가능)
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+DEFAULT_MEMORY_CACHE_TTL = 600
+
+# tb_summary_cache 정리 기본값
+DEFAULT_CACHE_MAX_ROWS = 100
+DEFAULT_EVICT_EVERY = 20     # N번의 삽입마다 한 번 정리
+DEFAULT_EVICT_BATCH = 500    # DELETE 한 번에 지우는 최대 행 수
+
+# 요약 프롬프트 버전 (build_summary_prompt를 바꾸면 올려서 진행 중인 요청과 구분)
+PROMPT_VERSION = 2  # 2: 본문 앞부분 자르기 대신 문장 추출 압축
+SINGLE_FLIGHT_TIMEOUT = 300  # 다른 호출자의 요약을 기다리는 최대 시간(초)
+MAP_WORKERS = 16  # map-reduce 조각 요약용 공유 스레드 수 (실제 동시 LLM 요청은 request_slot()이 제한)
+ARTICLE_TIMEOUT = 10  # 기사 다운로드 타임아웃 상한(초). 호스트별 breaker가 p95에 맞춰 줄임
+
+# 세션/스레드 사이에서 같은 기사의 동시 요약과 본문 다운로드를 하나로 합침
+_SUMMARY_FLIGHTS = SingleFlight()
+_ARTICLE_FLIGHTS = SingleFlight()
+
+# 모든 MapReduceSummaryStream이 공유하는 map 단계 실행기 (스트림마다 실행기를 만들지 않음)
+_MAP_EXECUTOR = ThreadPoolExecutor(max_workers=MAP_WORKERS, thread_name_prefix="summary-map")
+
+# 마이그레이션이 완료된 DB 키 (프로세스당 한 번만 실행)
+_MIGRATION_LOCK = threading.Lock()
+_MIGRATED = set()
+_MIGRATION_RUNNING = {}  # DB 키 -> 진행 중인 시도가 끝나면 set되는 Event
+# DB에 연결할 수 없을 때 재시도 간격(초). 그 사이의 호출은 연결을 시도하지 않고 바로 실패
+DB_RETRY_INTERVAL = 30
+_MIGRATION_FAILED = {}  # DB 키 -> 마지막 실패 시각 (time.monotonic)
+_POOL_FAILED = {}  # DB 키 -> 마지막 풀 생성 실패 시각
+
+# 프로세스 전역 NewsDatabase 싱글톤
+_DB_LOCK = threading.Lock()
+_DB_INSTANCES = {}
+
+
+def _timed_query(method):
+    """
+    NewsDatabase 메서드의 실행 시간을 db_query 단계 히스토그램에 기록합니다.
+
+    DB 작업만 하는 메서드에 사용합니다. 메모리 캐시 조회나 다른 메서드 호출(정리 등)이
+    섞인 메서드는 쿼리 블록만 LATENCY.timed("db_query", method=...)로 감싸세요.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with LATENCY.timed("db_query", method=method.__name__):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def _link_hash(link):
+    """tb_summary_cache의 키로 사용하는 링크 해시."""
+    return hashlib.md5(link.encode('utf-8')).hexdigest()
+
+
+def _column_exists(cursor, table, column):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+        (table, column)
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def _index_exists(cursor, table, index):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+        (table, index)
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def _migration_001_base_tables(cursor):
+    """메인 뉴스 테이블과 요약 캐시 테이블."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tb_news (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        title VARCHAR(255) NOT NULL,
+        link VARCHAR(500) NOT NULL,
+        published_date VARCHAR(100),
+        summary TEXT,
+        content TEXT,
+        source VARCHAR(50),
+        comment TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_link (link)
+    )
+    """)
+
+    # 이전 버전 테이블: comment 컬럼이 없으면 추가
+    if not _column_exists(cursor, 'tb_news', 'comment'):
+        logger.info("Adding comment column...")
+        cursor.execute("ALTER TABLE tb_news ADD COLUMN comment TEXT")
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tb_summary_cache (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        link_hash VARCHAR(255) NOT NULL,
+        link TEXT NOT NULL,
+        summary TEXT,
+        model VARCHAR(50),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY unique_link_hash (link_hash)
+    )
+    """)
+
+
+def _migration_002_summary_cache_created_at_index(cursor):
+    """정리(eviction) 쿼리가 전체 스캔하지 않도록 created_at 인덱스 추가."""
+    if not _index_exists(cursor, 'tb_summary_cache', 'idx_summary_cache_created_at'):
+        cursor.execute("CREATE INDEX idx_summary_cache_created_at ON tb_summary_cache (created_at)")
+
+
+def _migration_003_feed_state(cursor):
+    """재시작 후에도 Conditional GET을 쓸 수 있도록 피드별 검증자와 항목을 저장."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tb_feed_state (
+        source VARCHAR(50) PRIMARY KEY,
+        url VARCHAR(500) NOT NULL,
+        etag VARCHAR(255),
+        last_modified VARCHAR(100),
+        entries MEDIUMTEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+    """)
+
+
+def _migration_004_article_store(cursor):
+    """세션/재시작과 무관하게 기사 본문을 재사용하기 위한 저장소."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tb_article_store (
+        url_hash CHAR(32) PRIMARY KEY,
+        url TEXT NOT NULL,
+        content_hash CHAR(64),
+        text MEDIUMTEXT,
+        raw_size INT,
+        etag VARCHAR(255),
+        last_modified VARCHAR(100),
+        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+
+def _migration_005_news_created_at_index(cursor):
+    """저장된 기사 목록의 키셋 페이지네이션용 인덱스."""
+    if not _index_exists(cursor, 'tb_news', 'idx_news_created_at'):
+        cursor.execute("CREATE INDEX idx_news_created_at ON tb_news (created_at, id)")
+
+
+def _migration_006_news_fulltext_index(cursor):
+    """저장된 기사 검색용 FULLTEXT 인덱스 (한국어를 위해 ngram 파서 사용)."""
+    if _index_exists(cursor, 'tb_news', 'ft_news'):
+        return
+    try:
+        cursor.execute(
+            "ALTER TABLE tb_news ADD FULLTEXT INDEX ft_news (title, summary, content, comment) WITH PARSER ngram"
+        )
+    except mysql.connector.Error as err:
+        # ngram 파서가 없는 서버(MariaDB 등)는 기본 파서로 생성
+        logger.warning(f"ngram parser unavailable ({err}), using default FULLTEXT parser.")
+        cursor.execute("ALTER TABLE tb_news ADD FULLTEXT INDEX ft_news (title, summary, content, comment)")
+
+
+# (버전, 설명, 함수) - 버전 순서대로 한 번씩 적용됩니다. 새 마이그레이션은 끝에 추가하세요.
+SCHEMA_MIGRATIONS = [
+    (1, "base tables", _migration_001_base_tables),
+    (2, "tb_summary_cache created_at index", _migration_002_summary_cache_created_at_index),
+    (3, "tb_feed_state", _migration_003_feed_state),
+    (4, "tb_article_store", _migration_004_article_store),
+    (5, "tb_news created_at index", _migration_005_news_created_at_index),
+    (6, "tb_news fulltext index", _migration_006_news_fulltext_index),
+]
+
+
+def get_database(config_file='config.json'):
+    """
+    프로세스 전역 NewsDatabase를 반환합니다.
+
+    처음 호출될 때 스키마 마이그레이션을 실행하며, 이후에는 같은 인스턴스를
+    재사용합니다. UI, 워커 스레드, NewsFetcher 모두 이 함수를 사용하세요.
+    """
+    with _DB_LOCK:
+        db = _DB_INSTANCES.get(config_file)
+        if db is None:
+            db = NewsDatabase(config_file)
+            _DB_INSTANCES[config_file] = db
+    # 완료 후에는 집합 조회만, DB가 내려가 있으면 DB_RETRY_INTERVAL마다 한 번만 시도
+    db.migrate()
+    return db
+
 class NewsDatabase:
     """
     뉴스 항목 및 요약 캐싱을 위한 데이터베이스 상호 작용을 관리합니다.
@@ -19,11 +229,33 @@ class NewsDatabase:
     속성:
         config (dict): 로드된 구성.
         db_config (dict): 데이터베이스 연결 세부 정보.
+        pool_size (int): 커넥션 풀 크기 (news_db.pool_size).
+        pool_timeout (float): 풀 고갈 시 대기 시간 (news_db.pool_timeout).
+        summary_cache (TTLCache): tb_summary_cache 조회 결과(적중 및 미스)의 메모리 캐시.
+        cache_misses (bool): 미스도 메모리 캐시에 넣을지 여부. 수집 데몬(다른 프로세스)이
+            요약을 쓰는 경우(ingest_daemon.enabled)에는 False.
+        max_rows (int): tb_summary_cache에 유지할 최대 행 수 (0이면 제한 없음).
+        max_age_days (int): 캐시 항목의 최대 보관 일수 (0이면 제한 없음).
     """
     def __init__(self, config_file='config.json'):
         self.config = self._load_config(config_file)
-        self.db_config = self.config.get('news_db')
-        self.ensure_table_exists()
+        self.db_config = self.config.get('news_db') or {}
+        self.pool_size = int(self.db_config.get('pool_size', DEFAULT_POOL_SIZE))
+        self.pool_timeout = float(self.db_config.get('pool_timeout', DEFAULT_POOL_TIMEOUT))
+
+        cache_config = self.config.get('summary_cache', {})
+        self.summary_cache = TTLCache(
+            max_size=int(cache_config.get('memory_size', DEFAULT_MEMORY_CACHE_SIZE)),
+            ttl=float(cache_config.get('memory_ttl', DEFAULT_MEMORY_CACHE_TTL))
+        )
+        # 데몬이 쓴 요약은 이 프로세스의 메모리 캐시를 무효화할 수 없으므로 미스를 캐시하지 않음
+        self.cache_misses = not self.config.get('ingest_daemon', {}).get('enabled', False)
+        self.max_rows = int(cache_config.get('max_rows', DEFAULT_CACHE_MAX_ROWS))
+        self.max_age_days = int(cache_config.get('max_age_days', 0))
+        self.evict_every = max(1, int(cache_config.get('evict_every', DEFAULT_EVICT_EVERY)))
+        self.evict_batch = max(1, int(cache_config.get('evict_batch', DEFAULT_EVICT_BATCH)))
+        self._inserts_since_evict = 0
+        self._evict_lock = threading.Lock()
 
     def _load_config(self, config_file):
         """JSON 파일에서 구성을 로드합니다."""
@@ -32,123 +264,235 @@ class NewsDatabase:
                 return json.load(f)
         return {}
 
-    def ensure_table_exists(self):
+    def migrate(self, force=False):
         """
-        필요한 데이터베이스 테이블(tb_news, tb_summary_cache)이 존재하는지 확인합니다.
-        누락된 경우 생성합니다.
+        스키마 마이그레이션을 적용합니다 (프로세스당 한 번).
+
+        tb_schema_version에 기록된 버전 이후의 SCHEMA_MIGRATIONS만 순서대로
+        실행하므로, 이미 최신인 DB에서는 SELECT 한 번으로 끝납니다.
+
+        연결은 전역 잠금 밖에서 한 번에 한 스레드만 시도하며, 동시에 호출한 스레드는
+        그 결과를 기다립니다. 실패하면 DB_RETRY_INTERVAL 동안은 다시 시도하지 않고
+        바로 False를 반환합니다.
+
+        Args:
+            force (bool): 이 프로세스에서 이미 실행했더라도(또는 최근에 실패했더라도) 다시 확인합니다.
+
+        Returns:
+            bool: 스키마가 최신 상태이면 True.
         """
+        if not self.db_config:
+            # news_db가 설정되지 않음: DB 없이 동작 (캐시/저장 기능 비활성)
+            return False
+
+        key = self._db_key()
+        if key in _MIGRATED and not force:
+            return True
+
+        with _MIGRATION_LOCK:
+            if key in _MIGRATED and not force:
+                return True
+            failed_at = _MIGRATION_FAILED.get(key)
+            if not force and failed_at is not None and time.monotonic() - failed_at < DB_RETRY_INTERVAL:
+                return False
+            running = _MIGRATION_RUNNING.get(key)
+            if running is None:
+                running = _MIGRATION_RUNNING[key] = threading.Event()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            running.wait()
+            return key in _MIGRATED
+
+        ok = False
         try:
-            # 먼저 특정 DB에 연결 시도
+            ok = self._apply_migrations()
+        finally:
+            with _MIGRATION_LOCK:
+                if ok:
+                    _MIGRATED.add(key)
+                    _MIGRATION_FAILED.pop(key, None)
+                else:
+                    _MIGRATION_FAILED[key] = time.monotonic()
+                del _MIGRATION_RUNNING[key]
+            running.set()
+        return ok
+
+    def _apply_migrations(self):
+        """연결해서 밀린 마이그레이션을 적용합니다. migrate()가 한 스레드에서만 호출합니다."""
+        conn = self.get_connection()
+        if not conn:
+            # 연결 실패 시 DB가 없을 수 있음. 서버 루트에 연결 시도.
+            if not self._create_database():
+                return False
             conn = self.get_connection()
             if not conn:
-                # 연결 실패 시 DB가 없을 수 있음. 서버 루트에 연결 시도.
-                if not self._create_database():
-                    return
-                conn = self.get_connection()
-            
-            if conn:
-                cursor = conn.cursor()
-                # 메인 뉴스 테이블
-                create_table_query = """
-                CREATE TABLE IF NOT EXISTS tb_news (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(500) NOT NULL,
-                    published_date VARCHAR(100),
-                    summary TEXT,
-                    content TEXT,
-                    source VARCHAR(50),
-                    comment TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE KEY unique_link (link)
-                )
-                """
-                cursor.execute(create_table_query)
-                
-                # 마이그레이션: comment 컬럼이 없으면 추가
-                try:
-                    cursor.execute("SELECT comment FROM tb_news LIMIT 1")
-                    cursor.fetchall()
-                except:
-                    logger.info("Adding comment column...")
-                    cursor.execute("ALTER TABLE tb_news ADD COLUMN comment TEXT")
-                    
-                conn.commit()
-                cursor.close()
+                return False
 
-                # 캐시 테이블
-                cursor = conn.cursor()
-                create_cache_table_query = """
-                CREATE TABLE IF NOT EXISTS tb_summary_cache (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    link_hash VARCHAR(255) NOT NULL, 
-                    link TEXT NOT NULL,
-                    summary TEXT,
-                    model VARCHAR(50),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE KEY unique_link_hash (link_hash)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tb_schema_version (
+                version INT PRIMARY KEY,
+                description VARCHAR(255),
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """)
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM tb_schema_version")
+            current = cursor.fetchone()[0]
+
+            for version, description, migration in SCHEMA_MIGRATIONS:
+                if version <= current:
+                    continue
+                logger.info(f"Applying schema migration {version}: {description}")
+                migration(cursor)
+                cursor.execute(
+                    "INSERT INTO tb_schema_version (version, description) VALUES (%s, %s)",
+                    (version, description)
                 )
-                """
-                cursor.execute(create_cache_table_query)
                 conn.commit()
-                cursor.close()
-                
-                conn.close()
-                logger.info("Tables checked/created.")
+
+            cursor.close()
+            logger.info(f"Schema is up to date (version {SCHEMA_MIGRATIONS[-1][0]}).")
+            return True
         except Exception as e:
-            logger.error(f"Table setup error: {e}")
+            logger.error(f"Schema migration error: {e}")
+            return False
+        finally:
+            conn.close()
 
     def _create_database(self):
         """데이터베이스가 존재하지 않으면 생성합니다."""
         try:
             # 데이터베이스 없이 연결
-            conn = mysql.connector.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password']
-            )
+            args = self._connect_args()
+            args.pop('database')
+            conn = mysql.connector.connect(**args)
             cursor = conn.cursor()
             db_name = self.db_config['database']
             cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
             cursor.close()
             conn.close()
+            # 데이터베이스가 없어서 실패한 풀 생성을 바로 다시 시도할 수 있게 함
+            _POOL_FAILED.pop(self._db_key(), None)
             return True
         except Exception as e:
             logger.error(f"Create DB error: {e}")
             return False
 
-    def get_summary_from_cache(self, link):
+    def get_summary_from_cache(self, link, cache_misses=None):
         """
         주어진 링크에 대한 캐시된 요약을 검색합니다.
         
         Args:
             link (str): 뉴스 기사의 URL.
+            cache_misses (bool): 미스를 메모리 캐시에 넣을지 여부 (None이면 self.cache_misses).
             
         Returns:
-            str: 캐시된 요약 또는 찾을 수 없는 경우 None.
+            dict: { 'summary', 'model', 'created_at' } 또는 찾을 수 없는 경우 None.
         """
-        import hashlib
-        link_hash = hashlib.md5(link.encode('utf-8')).hexdigest()
+        link_hash = _link_hash(link)
+        if cache_misses is None:
+            cache_misses = self.cache_misses
+
+        cached = self.summary_cache.get(link_hash)
+        if cached is not MISSING and (cached is not None or cache_misses):
+            return cached
         
         conn = self.get_connection()
         if not conn: return None
         
         try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT summary, model, created_at FROM tb_summary_cache WHERE link_hash = %s", (link_hash,))
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            with LATENCY.timed("db_query", method="get_summary_from_cache"):
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute("SELECT summary, model, created_at FROM tb_summary_cache WHERE link_hash = %s", (link_hash,))
+                result = cursor.fetchone()
+                cursor.close()
+            entry = None
             if result:
-                return {
+                entry = {
                     'summary': result['summary'],
                     'model': result.get('model', 'unknown'),
                     'created_at': result['created_at']
                 }
-            return None
+            # 미스(None)도 캐시하여 같은 링크를 반복 조회하지 않음
+            if entry is not None or cache_misses:
+                self.summary_cache.set(link_hash, entry)
+            return entry
         except Exception as e:
             logger.error(f"Cache get error: {e}")
             return None
+        finally:
+            conn.close()
+
+    def get_summaries_from_cache(self, links, cache_misses=None):
+        """
+        여러 링크의 캐시된 요약을 한 번의 쿼리로 검색합니다.
+
+        Args:
+            links (list): 뉴스 기사 URL 목록.
+            cache_misses (bool): 미스를 메모리 캐시에 넣을지 여부 (None이면 self.cache_misses).
+                False이면 이전에 캐시된 미스도 무시하고 DB에서 다시 조회합니다.
+
+        Returns:
+            dict: { link: { 'summary', 'model', 'created_at' } }. 캐시에 없는 링크는 포함되지 않습니다.
+        """
+        hash_to_link = {_link_hash(link): link for link in links if link}
+        if cache_misses is None:
+            cache_misses = self.cache_misses
+
+        # 메모리 캐시에서 먼저 해결하고 나머지만 DB에서 조회
+        found = {}
+        pending = {}
+        for link_hash, link in hash_to_link.items():
+            cached = self.summary_cache.get(link_hash)
+            if cached is MISSING or (cached is None and not cache_misses):
+                pending[link_hash] = link
+            elif cached is not None:
+                found[link] = cached
+        if not pending:
+            return found
+
+        conn = self.get_connection()
+        if not conn: return found
+
+        try:
+            with LATENCY.timed("db_query", method="get_summaries_from_cache"):
+                cursor = conn.cursor(dictionary=True)
+                placeholders = ", ".join(["%s"] * len(pending))
+                cursor.execute(
+                    f"SELECT link_hash, summary, model, created_at FROM tb_summary_cache WHERE link_hash IN ({placeholders})",
+                    tuple(pending.keys())
+                )
+                rows = cursor.fetchall()
+                cursor.close()
+            entries = {
+                row['link_hash']: {
+                    'summary': row['summary'],
+                    'model': row.get('model', 'unknown'),
+                    'created_at': row['created_at']
+                }
+                for row in rows
+            }
+            for link_hash, link in pending.items():
+                entry = entries.get(link_hash)
+                if entry:
+                    self.summary_cache.set(link_hash, entry)
+                    found[link] = entry
+                elif cache_misses:
+                    self.summary_cache.set(link_hash, None)
+            return found
+        except Exception as e:
+            logger.error(f"Cache bulk get error: {e}")
+            return found
+        finally:
+            conn.close()
+
+    def get_cache_stats(self):
+        """메모리 요약 캐시의 적중/미스 카운터를 반환합니다."""
+        return self.summary_cache.stats()
 
     def save_summary_to_cache(self, link, summary, model="unknown"):
         """
@@ -159,60 +503,200 @@ class NewsDatabase:
             summary (str): 생성된 요약 텍스트.
             model (str): 생성에 사용된 모델.
         """
-        import hashlib
-        link_hash = hashlib.md5(link.encode('utf-8')).hexdigest()
+        link_hash = _link_hash(link)
         
         conn = self.get_connection()
         if not conn: return False
         
         try:
-            cursor = conn.cursor()
-            # Upsert
-            query = """
-            INSERT INTO tb_summary_cache (link_hash, link, summary, model)
-            VALUES (%s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE summary=%s, model=%s, created_at=NOW()
-            """
-            cursor.execute(query, (link_hash, link, summary, model, summary, model))
-            conn.commit()
-            
-            # 간단한 정리: 최근 100개 항목만 유지
-            cursor.execute("SELECT count(*) FROM tb_summary_cache")
-            count = cursor.fetchone()[0]
-            if count > 100:
-                # 가장 오래된 항목 삭제
-                delete_query = """
-                DELETE FROM tb_summary_cache 
-                WHERE id NOT IN (
-                    SELECT id FROM (
-                        SELECT id FROM tb_summary_cache ORDER BY created_at DESC LIMIT 100
-                    ) foo
-                )
+            # 정리(evict_summary_cache)는 자체 측정되므로 upsert만 측정
+            with LATENCY.timed("db_query", method="save_summary_to_cache"):
+                cursor = conn.cursor()
+                # Upsert
+                query = """
+                INSERT INTO tb_summary_cache (link_hash, link, summary, model)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE summary=%s, model=%s, created_at=NOW()
                 """
-                cursor.execute(delete_query)
+                cursor.execute(query, (link_hash, link, summary, model, summary, model))
                 conn.commit()
-
+            # 메모리 캐시 무효화 (다음 조회 시 DB의 새 값을 읽음)
+            self.summary_cache.pop(link_hash)
+            
             cursor.close()
-            conn.close()
-            return True
         except Exception as e:
             logger.error(f"Save error: {e}")
             return False
+        finally:
+            conn.close()
 
-    def get_connection(self):
-        """데이터베이스 연결을 설정하고 반환합니다."""
+        # 정리는 매 쓰기마다가 아니라 evict_every번의 삽입마다 한 번 실행
+        with self._evict_lock:
+            self._inserts_since_evict += 1
+            due = self._inserts_since_evict >= self.evict_every
+            if due:
+                self._inserts_since_evict = 0
+        if due:
+            self.evict_summary_cache()
+        return True
+
+    @_timed_query
+    def evict_summary_cache(self):
+        """
+        tb_summary_cache에서 오래된 항목을 일괄 삭제합니다.
+
+        summary_cache.max_age_days보다 오래된 항목과 최신 summary_cache.max_rows개를
+        넘는 항목을 created_at 인덱스를 이용해 evict_batch개씩 나누어 삭제합니다.
+        save_summary_to_cache가 주기적으로 호출하며, 별도 작업에서 직접 호출해도 됩니다.
+
+        Returns:
+            int: 삭제된 행 수.
+        """
+        conn = self.get_connection()
+        if not conn: return 0
+
+        deleted = 0
         try:
-            conn = mysql.connector.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                database=self.db_config['database']
-            )
-            return conn
-        except mysql.connector.Error as err:
-            logger.error(f"DB Connection Error: {err}")
+            cursor = conn.cursor()
+
+            if self.max_age_days > 0:
+                deleted += self._delete_in_batches(
+                    conn, cursor,
+                    "DELETE FROM tb_summary_cache WHERE created_at < NOW() - INTERVAL %s DAY "
+                    "ORDER BY created_at LIMIT %s",
+                    (self.max_age_days,)
+                )
+
+            if self.max_rows > 0:
+                # 최신 max_rows개 다음 행의 (created_at, id)를 기준선으로 사용 (인덱스 범위 스캔).
+                # created_at은 초 단위라 같은 초에 쓴 행이 많으므로 id로 순서를 확정해
+                # 정확히 max_rows개 밖의 행만 삭제
+                cursor.execute(
+                    "SELECT created_at, id FROM tb_summary_cache "
+                    "ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET %s",
+                    (self.max_rows,)
+                )
+                row = cursor.fetchone()
+                if row:
+                    deleted += self._delete_in_batches(
+                        conn, cursor,
+                        "DELETE FROM tb_summary_cache "
+                        "WHERE created_at < %s OR (created_at = %s AND id <= %s) "
+                        "ORDER BY created_at, id LIMIT %s",
+                        (row[0], row[0], row[1])
+                    )
+
+            cursor.close()
+        except Exception as e:
+            logger.error(f"Cache eviction error: {e}")
+        finally:
+            conn.close()
+
+        if deleted:
+            # 삭제된 항목이 메모리 캐시에 남지 않도록 비움
+            self.summary_cache.clear()
+            logger.info(f"Evicted {deleted} summary cache rows.")
+        return deleted
+
+    def _delete_in_batches(self, conn, cursor, query, params):
+        """LIMIT이 붙은 DELETE를 더 이상 지울 행이 없을 때까지 반복합니다."""
+        total = 0
+        while True:
+            cursor.execute(query, params + (self.evict_batch,))
+            conn.commit()
+            total += cursor.rowcount
+            if cursor.rowcount < self.evict_batch:
+                return total
+
+    def _connect_args(self):
+        """mysql.connector에 전달할 연결 인자를 만듭니다."""
+        args = {
+            'host': self.db_config['host'],
+            'user': self.db_config['user'],
+            'password': self.db_config['password'],
+            'database': self.db_config['database'],
+        }
+        if 'port' in self.db_config:
+            args['port'] = self.db_config['port']
+        if 'connection_timeout' in self.db_config:
+            args['connection_timeout'] = self.db_config['connection_timeout']
+        return args
+
+    def _db_key(self):
+        return (
+            self.db_config.get('host'),
+            self.db_config.get('port'),
+            self.db_config.get('user'),
+            self.db_config.get('database'),
+        )
+
+    def _get_pool(self):
+        """
+        이 DB 설정에 대한 프로세스 전역 커넥션 풀을 반환합니다 (없으면 생성).
+
+        풀은 (host, port, user, database) 단위로 공유되므로 여러 NewsDatabase
+        인스턴스와 백그라운드 스레드가 같은 연결들을 재사용합니다. 풀 생성에
+        실패하면 DB_RETRY_INTERVAL 동안은 다시 연결하지 않고 None을 반환합니다.
+        """
+        if not self.db_config:
+            return None
+
+        key = self._db_key()
+        pool = _POOLS.get(key)
+        if pool is not None:
+            return pool
+        failed_at = _POOL_FAILED.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < DB_RETRY_INTERVAL:
             return None
 
+        with _POOL_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                try:
+                    pool = pooling.MySQLConnectionPool(
+                        pool_name=f"news_pool_{len(_POOLS)}",
+                        pool_size=self.pool_size,
+                        pool_reset_session=True,
+                        **self._connect_args()
+                    )
+                except mysql.connector.Error as err:
+                    logger.error(f"DB Pool Error: {err}")
+                    _POOL_FAILED[key] = time.monotonic()
+                    return None
+                _POOL_FAILED.pop(key, None)
+                _POOLS[key] = pool
+                logger.info(f"DB connection pool created (size={self.pool_size}).")
+            return pool
+
+    def get_connection(self):
+        """
+        커넥션 풀에서 연결을 가져옵니다.
+
+        풀은 연결을 내줄 때 is_connected()로 상태를 확인하고 끊긴(stale) 연결은
+        자동으로 재연결합니다. 반환된 연결의 close()는 연결을 풀에 돌려줍니다.
+
+        Returns:
+            PooledMySQLConnection: 연결 또는 실패 시 None.
+        """
+        pool = self._get_pool()
+        if not pool:
+            return None
+
+        deadline = time.time() + self.pool_timeout
+        while True:
+            try:
+                return pool.get_connection()
+            except pooling.PoolError as err:
+                # 풀 고갈: 다른 스레드가 연결을 반환할 때까지 잠시 대기
+                if time.time() >= deadline:
+                    logger.error(f"DB Pool exhausted: {err}")
+                    return None
+                time.sleep(0.05)
+            except mysql.connector.Error as err:
+                logger.error(f"DB Connection Error: {err}")
+                return None
+
+    @_timed_query
     def save_article(self, article):
         """
         뉴스 기사를 메인 뉴스 테이블(tb_news)에 저장합니다.
@@ -260,20 +744,239 @@ class NewsDatabase:
             if conn:
                 conn.close()
 
-    def get_saved_articles(self):
-        """tb_news에서 저장된 모든 기사를 최신순으로 검색합니다."""
+    @_timed_query
+    def get_saved_articles(self, limit=20, before=None):
+        """
+        tb_news에서 저장된 기사 한 페이지를 최신순으로 검색합니다 (content 제외).
+
+        Args:
+            limit (int): 페이지 크기.
+            before (tuple): 이전 페이지 마지막 행의 (created_at, id). None이면 첫 페이지.
+
+        Returns:
+            list: id, title, link, source, created_at, summary, comment를 가진 dict 목록.
+        """
         conn = self.get_connection()
         if not conn:
             return []
         
         try:
             cursor = conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM tb_news ORDER BY created_at DESC")
+            columns = "id, title, link, source, created_at, summary, comment"
+            if before:
+                cursor.execute(
+                    f"SELECT {columns} FROM tb_news "
+                    "WHERE created_at < %s OR (created_at = %s AND id < %s) "
+                    "ORDER BY created_at DESC, id DESC LIMIT %s",
+                    (before[0], before[0], before[1], limit)
+                )
+            else:
+                cursor.execute(
+                    f"SELECT {columns} FROM tb_news ORDER BY created_at DESC, id DESC LIMIT %s",
+                    (limit,)
+                )
             return cursor.fetchall()
+        except mysql.connector.Error as err:
+            logger.error(f"Saved articles error: {err}")
+            return []
         finally:
             if conn:
                 conn.close()
 
+    @_timed_query
+    def search_articles(self, query, limit=20):
+        """
+        FULLTEXT 인덱스로 저장된 기사를 검색합니다 (관련도 순).
+
+        Args:
+            query (str): 검색어.
+            limit (int): 최대 결과 수.
+
+        Returns:
+            list: get_saved_articles()의 컬럼과 score, snippet(본문 중 첫 검색어 주변)을 가진 dict 목록.
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+        first_term = query.split()[0]
+
+        conn = self.get_connection()
+        if not conn:
+            return []
+
+        try:
+            cursor = conn.cursor(dictionary=True)
+            match = "MATCH(title, summary, content, comment) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+            # 스니펫은 DB에서 잘라내어 전체 content를 가져오지 않음
+            cursor.execute(
+                f"SELECT id, title, link, source, created_at, summary, comment, {match} AS score, "
+                "SUBSTRING(COALESCE(content, ''), GREATEST(LOCATE(%s, COALESCE(content, '')) - 80, 1), 240) AS snippet "
+                f"FROM tb_news WHERE {match} ORDER BY score DESC LIMIT %s",
+                (query, first_term, query, limit)
+            )
+            return cursor.fetchall()
+        except mysql.connector.Error as err:
+            logger.error(f"Search error: {err}")
+            return []
+        finally:
+            conn.close()
+
+    @_timed_query
+    def get_article_content(self, article_id):
+        """저장된 기사의 전체 본문(content)을 검색합니다."""
+        conn = self.get_connection()
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT content FROM tb_news WHERE id = %s", (article_id,))
+            row = cursor.fetchone()
+            cursor.close()
+            return row[0] if row else None
+        except mysql.connector.Error as err:
+            logger.error(f"Article content error: {err}")
+            return None
+        finally:
+            conn.close()
+
+    @_timed_query
+    def get_feed_state(self, source):
+        """
+        저장된 피드 상태(검증자 및 마지막 항목 목록)를 검색합니다.
+
+        Returns:
+            dict: { 'url', 'headers', 'entries' } 또는 없는 경우 None.
+        """
+        conn = self.get_connection()
+        if not conn: return None
+
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SELECT url, etag, last_modified, entries FROM tb_feed_state WHERE source = %s", (source,))
+            row = cursor.fetchone()
+            cursor.close()
+            if not row:
+                return None
+            headers = {}
+            if row['etag']:
+                headers['ETag'] = row['etag']
+            if row['last_modified']:
+                headers['Last-Modified'] = row['last_modified']
+            return {
+                'url': row['url'],
+                'headers': headers,
+                'entries': json.loads(row['entries']) if row['entries'] else []
+            }
+        except Exception as e:
+            logger.error(f"Feed state get error: {e}")
+            return None
+        finally:
+            conn.close()
+
+    @_timed_query
+    def save_feed_state(self, source, url, headers, entries):
+        """피드의 ETag/Last-Modified와 파싱된 항목 목록을 저장합니다 (Upsert)."""
+        conn = self.get_connection()
+        if not conn: return False
+
+        try:
+            cursor = conn.cursor()
+            query = """
+            INSERT INTO tb_feed_state (source, url, etag, last_modified, entries)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE url=VALUES(url), etag=VALUES(etag),
+                last_modified=VALUES(last_modified), entries=VALUES(entries)
+            """
+            cursor.execute(query, (
+                source, url, headers.get('ETag'), headers.get('Last-Modified'),
+                json.dumps(entries, ensure_ascii=False)
+            ))
+            conn.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            logger.error(f"Feed state save error: {e}")
+            return False
+        finally:
+            conn.close()
+
+    @_timed_query
+    def get_stored_article(self, url):
+        """
+        기사 저장소에서 URL의 추출된 본문을 검색합니다.
+
+        Returns:
+            dict: { 'text', 'content_hash', 'raw_size', 'etag', 'last_modified', 'fetched_at', 'age' }
+                  또는 없는 경우 None. age는 DB 시계 기준 fetched_at 이후 경과 시간(초)이므로
+                  앱과 DB 서버의 시간대가 달라도 정확합니다.
+        """
+        conn = self.get_connection()
+        if not conn: return None
+
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(
+                "SELECT text, content_hash, raw_size, etag, last_modified, fetched_at, "
+                "TIMESTAMPDIFF(SECOND, fetched_at, NOW()) AS age "
+                "FROM tb_article_store WHERE url_hash = %s",
+                (_link_hash(url),)
+            )
+            row = cursor.fetchone()
+            cursor.close()
+            return row
+        except Exception as e:
+            logger.error(f"Article store get error: {e}")
+            return None
+        finally:
+            conn.close()
+
+    @_timed_query
+    def save_stored_article(self, url, text, content_hash, raw_size, headers):
+        """추출된 본문과 원본 해시/크기/검증자를 기사 저장소에 저장합니다 (Upsert)."""
+        conn = self.get_connection()
+        if not conn: return False
+
+        try:
+            cursor = conn.cursor()
+            query = """
+            INSERT INTO tb_article_store (url_hash, url, content_hash, text, raw_size, etag, last_modified)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE content_hash=VALUES(content_hash), text=VALUES(text),
+                raw_size=VALUES(raw_size), etag=VALUES(etag), last_modified=VALUES(last_modified),
+                fetched_at=NOW()
+            """
+            cursor.execute(query, (
+                _link_hash(url), url, content_hash, text, raw_size,
+                headers.get('ETag'), headers.get('Last-Modified')
+            ))
+            conn.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            logger.error(f"Article store save error: {e}")
+            return False
+        finally:
+            conn.close()
+
+    @_timed_query
+    def touch_stored_article(self, url):
+        """재검증(304 또는 동일한 콘텐츠)된 기사의 fetched_at을 갱신합니다."""
+        conn = self.get_connection()
+        if not conn: return False
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE tb_article_store SET fetched_at = NOW() WHERE url_hash = %s", (_link_hash(url),))
+            conn.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            logger.error(f"Article store touch error: {e}")
+            return False
+        finally:
+            conn.close()
+
 class NewsFetcher:
     """
     뉴스 피드 가져오기 및 기사 내용 추출을 처리합니다.
@@ -281,7 +984,11 @@ class NewsFetcher:
     속성:
         sources (dict): 뉴스 소스 및 해당 RSS URL의 딕셔너리.
         llm_manager (LLMManager): AI 작업을 위한 인스턴스.
+        feed_entries (dict): 소스별 마지막으로 파싱된 항목 목록 (304 응답 시 재사용).
+        not_modified (set): 마지막 요청이 304였던 소스 이름.
     """
+    ALL_SOURCES = "All sources"
+
     def __init__(self, config_file='config.json'):
         self.config = self._load_config(config_file)
         self.sources = {
@@ -290,7 +997,31 @@ class NewsFetcher:
             "GeekNews": "https://news.hada.io/rss/news",
         }
         self.llm_manager = LLMManager()
+        self.extractor = ArticleExtractor.from_config(self.config)
         self.feed_headers = {} # 소스별 ETag/Last-Modified 저장
+        self.feed_entries = {}
+        self.not_modified = set()
+        self._state_loaded = set()
+
+        feed_config = self.config.get('feeds', {})
+        self.fetch_workers = int(feed_config.get('max_workers', 8))
+        self.per_host_limit = int(feed_config.get('per_host_limit', 2))
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+
+        # 기사 저장소 항목을 재검증 없이 사용할 수 있는 시간(초)
+        self.article_ttl = int(self.config.get('article_store', {}).get('ttl_seconds', 3600))
+
+        # 프롬프트에 넣을 본문의 토큰 예산 (문장 추출 압축)
+        prompt_config = self.config.get('summary_prompt', {})
+        self.prompt_max_tokens = int(prompt_config.get('max_input_tokens', text_compressor.DEFAULT_MAX_TOKENS))
+
+        # 긴 기사용 map-reduce 요약: 조각별 요약을 동시에 만든 뒤 하나로 합침
+        map_reduce = prompt_config.get('map_reduce', {})
+        self.map_reduce_enabled = bool(map_reduce.get('enabled', False))
+        self.map_reduce_min_tokens = int(map_reduce.get('min_tokens', self.prompt_max_tokens * 2))
+        self.map_reduce_chunk_tokens = int(map_reduce.get('chunk_tokens', self.prompt_max_tokens))
+        self.map_reduce_max_chunks = int(map_reduce.get('max_chunks', 8))
 
     def _load_config(self, config_file):
         if os.path.exists(config_file):
@@ -298,25 +1029,50 @@ class NewsFetcher:
                 return json.load(f)
         return {}
 
+    def _load_feed_state(self, source_name, url):
+        """DB에 저장된 검증자/항목을 소스당 한 번 메모리로 불러옵니다."""
+        if source_name in self._state_loaded:
+            return
+        self._state_loaded.add(source_name)
+        if source_name in self.feed_headers:
+            return
+        state = get_database().get_feed_state(source_name)
+        # 소스 URL이 바뀌었으면 이전 상태는 무시
+        if state and state['url'] == url:
+            self.feed_headers[source_name] = state['headers']
+            self.feed_entries[source_name] = state['entries']
+
+    def is_not_modified(self, source_name):
+        """마지막 가져오기에서 피드(ALL_SOURCES인 경우 모든 피드)가 변경되지 않았는지 여부."""
+        if source_name == self.ALL_SOURCES:
+            return all(name in self.not_modified for name in self.sources)
+        return source_name in self.not_modified
+
     def fetch_feeds(self, source_name):
         """
         Conditional GET을 사용하여 주어진 소스 이름에 대한 RSS 피드를 가져옵니다.
 
+        검증자와 마지막 항목 목록은 tb_feed_state에 저장되므로 재시작 후에도
+        304 응답으로 저장된 항목을 반환할 수 있습니다.
+
         Args:
             source_name (str): self.sources 중 하나와 일치하는 키.
 
         Returns:
-            list: 상위 10개 뉴스 항목(dict)의 목록, 또는 변경 사항이 없는 경우 None.
+            list: 상위 뉴스 항목(dict)의 목록. 304인 경우 저장된 항목 목록
+                  (저장된 항목이 없으면 None). is_not_modified()로 304 여부 확인.
         """
         url = self.sources.get(source_name)
         if not url:
             return []
+
+        self._load_feed_state(source_name, url)
         
         # 차단을 피하기 위해 헤더와 함께 requests 사용 (특히 YTN)
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
         
-        # Conditional GET 헤더 추가
-        if source_name in self.feed_headers:
+        # Conditional GET 헤더 추가 (304일 때 돌려줄 항목이 있는 경우에만)
+        if source_name in self.feed_headers and source_name in self.feed_entries:
             cached_headers = self.feed_headers[source_name]
             if 'ETag' in cached_headers:
                 headers['If-None-Match'] = cached_headers['ETag']
@@ -324,14 +1080,17 @@ class NewsFetcher:
                 headers['If-Modified-Since'] = cached_headers['Last-Modified']
 
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            with LATENCY.timed("feed_fetch", source=source_name):
+                resp = http_client.get_session().get(url, headers=headers, timeout=10)
             
             # 304 Not Modified 확인
             if resp.status_code == 304:
                 logger.info(f"Feed {source_name} not modified (304).")
-                return None # 변경 없음 신호
+                self.not_modified.add(source_name)
+                return self.feed_entries.get(source_name)
 
             resp.raise_for_status()
+            self.not_modified.discard(source_name)
             
             # 헤더 업데이트
             new_headers = {}
@@ -340,21 +1099,23 @@ class NewsFetcher:
             if 'Last-Modified' in resp.headers:
                 new_headers['Last-Modified'] = resp.headers['Last-Modified']
             
-            if new_headers:
-                self.feed_headers[source_name] = new_headers
+            self.feed_headers[source_name] = new_headers
             
             # 사용량 추적 (200 OK인 경우에만)
-            tracker = DataUsageTracker()
+            tracker = DataUsageTracker(source=source_name)
             tracker.add_rx(len(resp.content))
             
-            feed = feedparser.parse(resp.content)
+            with LATENCY.timed("feed_parse", source=source_name):
+                feed = feedparser.parse(resp.content)
         except Exception as e:
             logger.error(f"Error fetching feed for {source_name}: {e}")
+            self.not_modified.discard(source_name)
             return []
 
         entries = []
         for entry in feed.entries[:5]: # 5개로 제한
             published = entry.get('published', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            published_ts = 0
             
             # KST 변환 로직 추가
             if hasattr(entry, 'published_parsed') and entry.published_parsed:
@@ -367,6 +1128,7 @@ class NewsFetcher:
                     dt_kst = dt_utc.astimezone(kst_tz)
                     
                     published = dt_kst.strftime('%Y-%m-%d %H:%M:%S')
+                    published_ts = dt_utc.timestamp()
                 except Exception as e:
                     # 변환 실패 시 원본 문자열 유지
                     pass
@@ -375,148 +1137,335 @@ class NewsFetcher:
                 'title': entry.title,
                 'link': entry.link,
                 'published': published,
+                'published_ts': published_ts,
                 'source': source_name
             })
+        self.feed_entries[source_name] = entries
+        get_database().save_feed_state(source_name, url, self.feed_headers[source_name], entries)
         return entries
 
-    def get_full_text(self, url):
+    def _host_semaphore(self, url):
+        """호스트별 동시 요청 수를 per_host_limit으로 제한하는 세마포어."""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            sem = self._host_semaphores.get(host)
+            if sem is None:
+                sem = threading.Semaphore(self.per_host_limit)
+                self._host_semaphores[host] = sem
+            return sem
+
+    def _fetch_source_limited(self, source_name):
+        with self._host_semaphore(self.sources[source_name]):
+            return self.fetch_feeds(source_name)
+
+    def fetch_all_feeds(self):
         """
-        뉴스 기사 URL에서 전체 텍스트 콘텐츠를 추출합니다.
-        
-        Google 뉴스 리디렉션 및 다양한 HTML 구조를 처리합니다.
+        self.sources의 모든 피드를 병렬로 가져와 하나의 목록으로 병합합니다.
+
+        피드는 스레드 풀에서 동시에 가져오므로 전체 시간은 가장 느린 피드 하나와
+        비슷합니다. 304(변경 없음)인 소스는 마지막으로 가져온 항목을 재사용합니다.
+
+        Returns:
+            list: 게시 시간 역순으로 정렬되고 링크 기준으로 중복 제거된 항목 목록.
+                  모든 소스가 304였는지는 is_not_modified(ALL_SOURCES)로 확인합니다.
+        """
+        names = list(self.sources.keys())
+        with ThreadPoolExecutor(max_workers=max(1, min(self.fetch_workers, len(names)))) as executor:
+            results = list(executor.map(self._fetch_source_limited, names))
+        return self._merge_entries(results)
+
+    def _merge_entries(self, entry_lists):
+        """여러 소스의 항목 목록을 링크 기준으로 중복 제거하고 최신순으로 정렬합니다."""
+        merged = []
+        seen = set()
+        for entries in entry_lists:
+            for item in entries or []:
+                if item['link'] in seen:
+                    continue
+                seen.add(item['link'])
+                merged.append(item)
+
+        merged.sort(key=lambda item: item.get('published_ts', 0), reverse=True)
+        return merged
+
+    def load_stored_feeds(self, source_name):
+        """
+        네트워크 없이 tb_feed_state에 저장된 항목을 반환합니다.
+
+        수집 데몬(ingest_daemon.py)이 피드를 미리 가져오는 경우 UI는 이 함수로
+        즉시 목록을 표시합니다. source_name이 ALL_SOURCES이면 모든 소스를 병합합니다.
+
+        Returns:
+            list: 저장된 항목 목록 (없으면 빈 목록).
+        """
+        names = list(self.sources.keys()) if source_name == self.ALL_SOURCES else [source_name]
+        db = get_database()
+        entry_lists = []
+        for name in names:
+            state = db.get_feed_state(name)
+            if state and state['url'] == self.sources.get(name):
+                entry_lists.append(state['entries'])
+        return self._merge_entries(entry_lists)
+
+    def download_article(self, url, extra_headers=None):
+        """
+        기사 HTML을 다운로드합니다. Google 뉴스 리디렉션을 따라갑니다.
 
         Args:
             url (str): 기사 URL.
+            extra_headers (dict): 첫 요청에 추가할 헤더 (예: Conditional GET 검증자).
 
         Returns:
-            str: 추출된 텍스트 콘텐츠 또는 오류 메시지.
+            requests.Response: 최종 응답. 네트워크 오류는 호출자에게 전파됩니다.
+        """
+        with LATENCY.timed("article_download", host=urlparse(url).netloc):
+            return self._download_article(url, extra_headers)
+
+    def _guarded_get(self, url, headers):
+        """
+        호스트별 서킷 브레이커를 거쳐 GET 요청을 보냅니다.
+
+        breaker가 open이면 요청 없이 CircuitOpenError를 던지고, 타임아웃은 해당 호스트의
+        최근 응답 시간 p95에 맞춰 ARTICLE_TIMEOUT 이하로 조정됩니다. 연결 오류와 5xx는
+        실패로 기록합니다. 재시도는 breaker가 맡으므로 재시도 없는 세션을 사용합니다.
         """
+        breaker = get_breakers().get(urlparse(url).netloc)
+        breaker.before_call()
+        start = time.perf_counter()
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            # Google 뉴스 리디렉션 처리 (JS 리디렉션)
-            if "news.google.com" in response.url or "news.google.com" in url:
-                # 응답 콘텐츠에서 실제 URL 찾기 시도
-                import re
-                # 자주 사용되는 패턴: window.location.replace("..."); 또는 <a href="...">
-                # 메인 리디렉션 링크를 찾기 위한 간단한 시도
-                match = re.search(r'window\.location\.replace\("(.+?)"\)', response.text)
-                if match:
-                    real_url = match.group(1).replace('\\u003d', '=').replace('\\x3d', '=')
-                    logger.info(f"Redirecting Google URL to: {real_url}")
-                    response = requests.get(real_url, headers=headers, timeout=10)
-                else:
-                    # 폴백: 위 방법이 실패하면 일반 href 찾기
-                    soup_redirect = BeautifulSoup(response.content, 'html.parser')
-                    # 위험하지만 noscript 블록에 대해 가끔 작동함
-                    links = soup_redirect.find_all('a')
-                    if links and len(links) < 5: # 페이지가 거의 비어 있는 경우
-                        real_url = links[0].get('href')
-                        if real_url:
-                             response = requests.get(real_url, headers=headers, timeout=10)
-                             DataUsageTracker().add_rx(len(response.content))
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 스크립트 및 스타일 제거
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
+            response = http_client.get_session(retries=False).get(
+                url, headers=headers, timeout=breaker.timeout(ARTICLE_TIMEOUT)
+            )
+        except Exception as e:
+            breaker.record_failure(e)
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure(f"HTTP {response.status_code}")
+        else:
+            breaker.record_success(time.perf_counter() - start)
+        return response
 
-            # 개선된 추출 로직
-            # 1. itemprop="articleBody" 찾기 (MK와 같은 현대적인 뉴스 사이트에서 일반적)
-            article_body = soup.find(attrs={"itemprop": "articleBody"})
-            
-            # 2. 'article' 태그 찾기
-            article_tag = soup.find('article')
-            
-            # 3. 특정 클래스 찾기 (MK 등)
-            class_candidates = soup.find_all('div', class_=lambda x: x and x in ['art_txt', 'view_txt', 'news_view'])
-
-            target_element = None
-            if article_body:
-                target_element = article_body
-            elif article_tag:
-                target_element = article_tag
-            elif class_candidates:
-                # 여러 후보를 필요한 경우 더미 태그로 감싸거나, 첫 번째/가장 큰 것을 선택
-                # 간단하게 후보를 찾으면 첫 번째를 메인으로 처리하거나 리스트로 처리
-                # 하지만 그들을 위한 새로운 soup 객체를 만드는 것이 더 깔끔함
-                target_element = soup.new_tag('div')
-                for c in class_candidates:
-                    target_element.append(c)
-
-            text_content = []
-            
-            if target_element:
-                # 전처리 단계: HTML 구조를 Markdown 스타일 텍스트로 변환
-                
-                # 코드 블록 처리 (<pre>)
-                for pre in target_element.find_all('pre'):
-                    code_text = pre.get_text()
-                    # 콘텐츠를 펜스 코드 블록으로 교체
-                    pre.string = f"\n```\n{code_text}\n```\n"
-                
-                # 리스트 처리 (<ul>, <ol>) - 간단한 근사치
-                for ul in target_element.find_all('ul'):
-                    for li in ul.find_all('li'):
-                        li.string = f"- {li.get_text()}"
-                
-                # 제목 처리 (h1-h3) - 선택 사항이지만 좋음
-                for i in range(1, 4):
-                    for h in target_element.find_all(f'h{i}'):
-                        h.string = f"\n{'#' * i} {h.get_text()}\n"
-                
-                text = target_element.get_text(separator='\n\n')
-                
-                # 과도한 개행 정리
-                import re
-                text = re.sub(r'\n{3,}', '\n\n', text)
-                text_content.append(text.strip())
+    def _download_article(self, url, extra_headers):
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+        response = self._guarded_get(url, {**headers, **(extra_headers or {})})
 
+        # Google 뉴스 리디렉션 처리 (JS 리디렉션)
+        if "news.google.com" in response.url or "news.google.com" in url:
+            # 응답 콘텐츠에서 실제 URL 찾기 시도
+            import re
+            # 자주 사용되는 패턴: window.location.replace("..."); 또는 <a href="...">
+            # 메인 리디렉션 링크를 찾기 위한 간단한 시도
+            match = re.search(r'window\.location\.replace\("(.+?)"\)', response.text)
+            if match:
+                real_url = match.group(1).replace('\\u003d', '=').replace('\\x3d', '=')
+                logger.info(f"Redirecting Google URL to: {real_url}")
+                response = self._guarded_get(real_url, headers)
             else:
-                # 모든 p 태그로 폴백
-                paragraphs = soup.find_all('p')
-                for p in paragraphs:
-                    txt = p.get_text().strip()
-                    if len(txt) > 40:
-                        text_content.append(txt)
-            
-            text = '\n\n'.join(text_content)
-            
-            # 캡처된 경우 MK의 내부 AI 요약 제거 (종종 "뉴스 요약쏙"으로 시작)
-            if "뉴스 요약쏙" in text:
-                # 상단에 나타나는 경우 헤더 쓰레기를 제거하기 위한 간단한 분할
-                parts = text.split("뉴스 요약쏙")
-                if len(parts) > 1:
-                    # 보통 요약은 상단에 있고, 실제 콘텐츠는 그 뒤에?
-                    # 사실 MK는 요약을 대부분 별도 div에 넣음.
-                    # 하지만 'articleBody'를 잡았다면 깨끗할 것임.
-                    pass
-            
-            if not text and "news.google.com" in url:
-                return "⚠️ Content extraction failed. Google News often blocks full-text extraction tools. Please use the 'Link' button to read the original article."
+                # 폴백: 위 방법이 실패하면 일반 href 찾기
+                soup_redirect = BeautifulSoup(response.content, 'html.parser')
+                # 위험하지만 noscript 블록에 대해 가끔 작동함
+                links = soup_redirect.find_all('a')
+                if links and len(links) < 5: # 페이지가 거의 비어 있는 경우
+                    real_url = links[0].get('href')
+                    if real_url:
+                         response = self._guarded_get(real_url, headers)
+                         DataUsageTracker().add_rx(len(response.content))
+
+        return response
+
+    def extract_text(self, content, url):
+        """
+        다운로드한 HTML에서 본문 텍스트를 추출합니다 (네트워크 없음).
+
+        실제 추출은 사이트 규칙 레지스트리를 가진 ArticleExtractor가 담당합니다.
+
+        Args:
+            content (bytes): 기사 HTML.
+            url (str): 기사 URL (사이트별 처리 및 오류 메시지용).
+
+        Returns:
+            str: 추출된 텍스트 콘텐츠 또는 안내 메시지.
+        """
+        with LATENCY.timed("extraction"):
+            return self.extractor.extract(content, url)
+
+    def download_article_cached(self, url):
+        """
+        기사 저장소를 거쳐 기사를 가져옵니다.
+
+        저장된 본문이 article_ttl보다 최근이면 네트워크 없이 반환하고, 오래되었으면
+        ETag/Last-Modified로 재검증합니다. 304이거나 받은 HTML의 해시가 같으면
+        저장된 본문을 재사용합니다. 재검증이 실패하면(네트워크 오류, breaker open 등)
+        오래된 저장 본문을 그대로 반환합니다.
+
+        Returns:
+            tuple: (text, response). text가 None이 아니면 저장소에서 해결된 것이고,
+                   None이면 response.content를 추출한 뒤 store_article_text()로 저장해야 합니다.
+        """
+        db = get_database()
+        stored = db.get_stored_article(url)
+        if stored and stored['text'] in (EXTRACTION_FAILED, GOOGLE_NEWS_BLOCKED):
+            # 이전 버전이 저장한 추출 실패 안내문은 무시하고 다시 추출
+            stored = None
+
+        extra_headers = {}
+        if stored:
+            if stored['age'] is not None and stored['age'] < self.article_ttl:
+                return stored['text'], None
+            if stored['etag']:
+                extra_headers['If-None-Match'] = stored['etag']
+            if stored['last_modified']:
+                extra_headers['If-Modified-Since'] = stored['last_modified']
+
+        try:
+            response = self.download_article(url, extra_headers)
+            if stored and response.status_code == 304:
+                db.touch_stored_article(url)
+                return stored['text'], response
+            response.raise_for_status()
+        except Exception as e:
+            if not stored:
+                raise
+            logger.warning(f"Revalidation failed for {url}, serving stored text: {e}")
+            return stored['text'], None
+
+        if stored and stored['content_hash'] == hashlib.sha256(response.content).hexdigest():
+            db.touch_stored_article(url)
+            return stored['text'], response
+        return None, response
+
+    def store_article_text(self, url, response, text):
+        """
+        download_article_cached()가 받은 응답에서 추출한 본문을 기사 저장소에 저장합니다.
+
+        추출 실패 안내문은 저장하지 않습니다. 저장하면 HTML 해시가 같은 동안 재추출되지
+        않아 site_rules를 고쳐도 실패가 남습니다.
+        """
+        if text in (EXTRACTION_FAILED, GOOGLE_NEWS_BLOCKED):
+            return
+        headers = {k: response.headers[k] for k in ('ETag', 'Last-Modified') if k in response.headers}
+        get_database().save_stored_article(
+            url, text, hashlib.sha256(response.content).hexdigest(), len(response.content), headers
+        )
+
+    def get_full_text(self, url):
+        """
+        뉴스 기사 URL에서 전체 텍스트 콘텐츠를 추출합니다.
+        
+        Google 뉴스 리디렉션 및 다양한 HTML 구조를 처리합니다. 추출 결과는 기사
+        저장소에 보관되어 세션과 재시작에 걸쳐 재사용됩니다.
 
-            return text if text else "Could not extract text content. Site structure might be complex."
+        Args:
+            url (str): 기사 URL.
+
+        Returns:
+            str: 추출된 텍스트 콘텐츠 또는 오류 메시지.
+        """
+        def load():
+            text, response = self.download_article_cached(url)
+            if text is None:
+                text = self.extract_text(response.content, url)
+                self.store_article_text(url, response, text)
+            return text
+
+        try:
+            # 다른 세션/스레드가 같은 기사를 가져오는 중이면 그 결과를 공유
+            return _ARTICLE_FLIGHTS.do(url, load, timeout=SINGLE_FLIGHT_TIMEOUT)
         except Exception as e:
             logger.error(f"Error fetching text: {e}")
             return f"Error fetching content: {e}"
 
-    def generate_summary(self, text, model, link=None, force_refresh=False):
+    def build_summary_prompt(self, text):
         """
-        LLM을 사용하여 3개의 글머리 기호 요약을 생성합니다.
-        Returns:
-            dict: { 'text': str, 'meta': dict }
+        요약 프롬프트를 만듭니다 (작은 모델(0.5b)을 위한 더 강력한 프롬프트).
+
+        본문은 앞부분을 자르는 대신 text_compressor로 중요한 문장만 골라
+        prompt_max_tokens 예산 안에 넣습니다.
+        """
+        with LATENCY.timed("compression"):
+            content = text_compressor.compress(text, self.prompt_max_tokens)
+        return f"""### System:
+You are a summary assistant. Output ONLY the summary in English. Do not say anything else.
+
+### Instruction:
+Summarize the content below into 3 bullet points.
+- Use English ONLY.
+- Use simple English to read easily.
+- NO introduction (e.g. "Here is the summary").
+- NO conclusion.
+
+### Content:
+{content}
+
+### Response:
+"""
+
+    def build_chunk_prompt(self, text):
+        """map 단계 프롬프트: 기사 한 조각의 핵심을 짧게 요약합니다."""
+        return f"""### System:
+You are a summary assistant. Output ONLY the summary in English. Do not say anything else.
+
+### Instruction:
+The content below is one part of a longer article.
+Summarize its key facts in at most 3 short bullet points.
+- Use English ONLY.
+- NO introduction or conclusion.
+
+### Content:
+{text}
+
+### Response:
+"""
+
+    def build_merge_prompt(self, partial_summaries):
+        """reduce 단계 프롬프트: 조각별 요약을 최종 3개 글머리 기호로 합칩니다."""
+        parts = "\n\n".join(f"Part {i + 1}:\n{summary.strip()}" for i, summary in enumerate(partial_summaries))
+        return f"""### System:
+You are a summary assistant. Output ONLY the summary in English. Do not say anything else.
+
+### Instruction:
+Below are summaries of consecutive parts of one article.
+Combine them into 3 bullet points covering the whole article.
+- Use English ONLY.
+- Use simple English to read easily.
+- NO introduction (e.g. "Here is the summary").
+- NO conclusion.
+
+### Content:
+{parts}
+
+### Response:
+"""
+
+    def use_map_reduce(self, text):
+        """설정이 켜져 있고 본문이 min_tokens보다 길면 map-reduce 모드를 사용합니다."""
+        return self.map_reduce_enabled and text_compressor.estimate_tokens(text) > self.map_reduce_min_tokens
+
+    def _new_summary_stream(self, text, model, link=None, flight=None):
+        if self.use_map_reduce(text):
+            chunks = text_compressor.chunk(text, self.map_reduce_chunk_tokens)
+            if len(chunks) > self.map_reduce_max_chunks:
+                # 조각이 너무 많으면 각 조각 예산을 늘리는 대신 전체를 먼저 압축
+                budget = self.map_reduce_chunk_tokens * self.map_reduce_max_chunks
+                chunks = text_compressor.chunk(text_compressor.compress(text, budget), self.map_reduce_chunk_tokens)
+                chunks = chunks[:self.map_reduce_max_chunks]
+            return MapReduceSummaryStream(self, chunks, model, link, flight=flight)
+        return SummaryStream(self.llm_manager, self.build_summary_prompt(text), model, link, flight=flight)
+
+    def stream_summary(self, text, model, link=None, force_refresh=False):
+        """
+        요약을 토큰 단위로 생성하는 SummaryStream을 반환합니다.
+
+        캐시 적중이나 짧은 텍스트의 경우 완성된 결과를 한 번에 내보냅니다.
+        반복이 끝나면 stream.result에 generate_summary()와 같은 형식의 결과가 담깁니다.
         """
-        import time
-        
         # 1. 링크가 제공되고 강제 새로고침이 아닌 경우 캐시 확인
         if link and not force_refresh:
-            db = NewsDatabase()
+            db = get_database()
             cached_data = db.get_summary_from_cache(link)
             if cached_data:
                 # cached_data는 { 'summary', 'model', 'created_at' }임
-                return {
+                return SummaryStream.from_result({
                     'text': cached_data['summary'],
                     'meta': {
                         'source': 'Cache',
@@ -524,52 +1473,186 @@ class NewsFetcher:
                         'time': 'N/A',
                         'host': 'DB'
                     }
-                }
+                })
         
         if not text or len(text) < 100:
-            return {'text': "Text too short to summarize.", 'meta': {}}
-        
-        # 작은 모델(0.5b)을 위한 더 강력한 프롬프트
-        prompt = f"""### System:
-You are a summary assistant. Output ONLY the summary in English. Do not say anything else.
+            return SummaryStream.from_result({'text': "Text too short to summarize.", 'meta': {}})
 
-### Instruction:
-Summarize the content below into 3 bullet points.
-- Use English ONLY.
-- Use simple English to read easily.
-- NO introduction (e.g. "Here is the summary").
-- NO conclusion.
+        if not link:
+            return self._new_summary_stream(text, model)
 
-### Content:
-{text[:3000]}
+        # 같은 (링크, 모델, 프롬프트 버전, 모드)의 요약이 이미 진행 중이면 그 결과를 공유
+        key = (link, model, PROMPT_VERSION, self.use_map_reduce(text))
+        call, leader = _SUMMARY_FLIGHTS.begin(key)
+        if leader:
+            return self._new_summary_stream(text, model, link, flight=(key, call))
+        try:
+            return SummaryStream.from_result(_SUMMARY_FLIGHTS.wait(call, SINGLE_FLIGHT_TIMEOUT))
+        except Exception as e:
+            logger.warning(f"Shared summary unavailable, generating separately: {e}")
+            return self._new_summary_stream(text, model, link)
 
-### Response:
-"""
+    def generate_summary(self, text, model, link=None, force_refresh=False):
+        """
+        LLM을 사용하여 3개의 글머리 기호 요약을 생성합니다.
+        Returns:
+            dict: { 'text': str, 'meta': dict }
+        """
+        stream = self.stream_summary(text, model, link=link, force_refresh=force_refresh)
+        for _ in stream:
+            pass
+        return stream.result
+
+
+class SummaryStream:
+    """
+    요약 텍스트 조각을 생성되는 대로 내보내는 이터러블.
+
+    st.write_stream()에 바로 넘길 수 있으며, 반복이 끝나면 result에
+    { 'text', 'meta' }가 담기고 (링크가 있으면) 요약 캐시에 저장됩니다.
+    meta에는 총 소요 시간(time)과 첫 토큰까지의 시간(ttft)이 기록됩니다.
+    flight가 주어지면 (single-flight leader) 끝날 때 기다리는 호출자들에게 결과를 전달합니다.
+    LLM 스트림이 실패하면(StreamError, 중간에 끊긴 경우 포함) failed가 True가 되고
+    결과는 캐시에도, 기다리는 호출자에게도 전달되지 않습니다.
+    """
+    def __init__(self, llm_manager, prompt, model, link=None, flight=None):
+        self.llm_manager = llm_manager
+        self.prompt = prompt
+        self.model = model
+        self.link = link
+        self.flight = flight
+        self.result = None
+        self.failed = False
+
+    @classmethod
+    def from_result(cls, result):
+        """이미 완성된 결과(캐시 등)를 한 번에 내보내는 스트림."""
+        stream = cls(None, None, None)
+        stream.result = result
+        return stream
+
+    def __iter__(self):
+        if self.llm_manager is None:
+            yield self.result['text']
+            return
+
+        try:
+            yield from self._generate()
+        finally:
+            if self.flight:
+                key, call = self.flight
+                self.flight = None
+                if self.result is not None and not self.failed:
+                    _SUMMARY_FLIGHTS.finish(key, call, result=self.result)
+                elif self.failed:
+                    # 실패한(잘린) 요약은 공유하지 않고 기다리는 호출자가 직접 생성하도록 함
+                    _SUMMARY_FLIGHTS.finish(key, call, error=RuntimeError("summary stream failed"))
+                else:
+                    # 스트림이 중간에 중단된 경우 기다리는 호출자가 직접 생성하도록 함
+                    _SUMMARY_FLIGHTS.finish(key, call, error=RuntimeError("summary stream aborted"))
+
+    def __del__(self):
+        # 반복되지 않고 버려진 leader 스트림도 기다리는 호출자를 풀어줌
+        if self.flight:
+            key, call = self.flight
+            _SUMMARY_FLIGHTS.finish(key, call, error=RuntimeError("summary stream discarded"))
+
+    def _generate(self):
         start_time = time.time()
-        summary = self.llm_manager.generate_response(prompt, model)
-        end_time = time.time()
-        elapsed = round(end_time - start_time, 2)
+        ttft = None
+        chunks = []
+        for chunk in self.llm_manager.stream_response(self.prompt, self.model):
+            if ttft is None:
+                ttft = round(time.time() - start_time, 2)
+            if isinstance(chunk, StreamError):
+                self.failed = True
+            chunks.append(chunk)
+            yield chunk
+        elapsed = round(time.time() - start_time, 2)
+        if ttft is None:
+            ttft = elapsed
         
+        yield from self._finish(chunks, elapsed, ttft)
+
+    def _finish(self, chunks, elapsed, ttft, footer_extra="", meta_extra=None):
+        """바닥글을 내보내고 요약을 캐시에 저장한 뒤 result를 채웁니다."""
         current_host = self.llm_manager.current_host_label
         
         # 지속성을 위해 요약에 메타데이터 바닥글 추가
         # "작은" 느낌을 위해 마크다운 기울임꼴 사용
-        footer = f"\n\n*(⏱ {elapsed}s | {model} | {current_host})*"
-        full_summary = summary + footer
+        footer = f"\n\n*(⏱ {elapsed}s | TTFT {ttft}s{footer_extra} | {self.model} | {current_host})*"
+        yield footer
+        full_summary = "".join(chunks) + footer
         
         # 2. 링크가 제공된 경우 캐시 저장 (존재하면 업데이트)
-        if link and full_summary:
-            db = NewsDatabase()
-            db.save_summary_to_cache(link, full_summary, model)
+        # 실패한 스트림(예: breaker open, 중간에 끊긴 응답)은 캐시하지 않아 호스트가 회복되면 다시 생성됨
+        if self.link and full_summary and not self.failed and not full_summary.startswith("Error:"):
+            db = get_database()
+            db.save_summary_to_cache(self.link, full_summary, self.model)
             
-        return {
+        self.result = {
             'text': full_summary,
             'meta': {
                 'source': 'Live',
-                'model': model,
+                'model': self.model,
                 'time': f"{elapsed}s",
-                'host': current_host
+                'ttft': f"{ttft}s",
+                'host': current_host,
+                **(meta_extra or {})
             }
         }
 
 
+class MapReduceSummaryStream(SummaryStream):
+    """
+    긴 기사를 조각별로 요약(map)한 뒤 하나의 3개 글머리 기호 요약으로 합치는(reduce) 스트림.
+
+    map 단계는 공유 실행기에서 실행되며, 동시 LLM 요청 수는 파이프라인 요약 단계와
+    함께 쓰는 llm_manager.request_slot()이 제한합니다. reduce 단계는
+    토큰 단위로 스트리밍합니다. meta에는 전체 시간과 함께 조각별 시간(chunk_times)과
+    map 단계 시간(map_time)이 기록되며, 캐시에는 최종 결과만 저장됩니다.
+    """
+    def __init__(self, fetcher, chunks, model, link=None, flight=None):
+        super().__init__(fetcher.llm_manager, None, model, link, flight=flight)
+        self.fetcher = fetcher
+        self.chunks = chunks
+
+    def _summarize_chunk(self, chunk):
+        start = time.time()
+        summary = self.llm_manager.generate_response(self.fetcher.build_chunk_prompt(chunk), self.model)
+        return summary, round(time.time() - start, 2)
+
+    def _generate(self):
+        start_time = time.time()
+        with LATENCY.timed("summary_map", model=self.model):
+            mapped = list(_MAP_EXECUTOR.map(self._summarize_chunk, self.chunks))
+        map_time = round(time.time() - start_time, 2)
+
+        partials = [summary for summary, _ in mapped if summary and not summary.startswith("Error:")]
+        chunk_times = [f"{seconds}s" for _, seconds in mapped]
+        if not partials:
+            # 모든 조각이 실패하면 첫 번째 오류를 그대로 보여줌 (캐시하지 않음)
+            error = mapped[0][0] if mapped else "Error: empty article"
+            self.failed = True
+            self.result = {'text': error, 'meta': {'source': 'Live', 'model': self.model}}
+            yield error
+            return
+
+        ttft = None
+        chunks = []
+        for chunk in self.llm_manager.stream_response(self.fetcher.build_merge_prompt(partials), self.model):
+            if ttft is None:
+                ttft = round(time.time() - start_time, 2)
+            if isinstance(chunk, StreamError):
+                self.failed = True
+            chunks.append(chunk)
+            yield chunk
+        elapsed = round(time.time() - start_time, 2)
+        if ttft is None:
+            ttft = elapsed
+
+        yield from self._finish(
+            chunks, elapsed, ttft,
+            footer_extra=f" | map {len(self.chunks)}× {map_time}s",
+            meta_extra={'mode': 'map-reduce', 'map_time': f"{map_time}s", 'chunk_times': chunk_times},
+        )
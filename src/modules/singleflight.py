@@ -0,0 +1,73 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 작업을 하나로 합칩니다.
+
+    먼저 도착한 호출자(leader)만 실제 작업을 수행하고, 그 사이에 같은 키로 들어온
+    호출자들은 leader의 결과를 기다렸다가 공유합니다. 작업이 끝나면 키는 제거되므로
+    이후 호출은 새로 실행됩니다 (결과 캐시가 아님).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def begin(self, key):
+        """
+        키에 대한 진행 중인 호출을 반환합니다.
+
+        Returns:
+            tuple: (call, is_leader). is_leader가 True이면 호출자가 작업을 수행하고
+                   반드시 finish()를 호출해야 합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            return call, True
+
+    def finish(self, key, call, result=None, error=None):
+        """leader가 작업 결과(또는 오류)를 기다리는 호출자들에게 전달합니다."""
+        call.result = result
+        call.error = error
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.done.set()
+
+    def wait(self, call, timeout=None):
+        """
+        leader의 결과를 기다립니다.
+
+        Raises:
+            TimeoutError: timeout 안에 끝나지 않은 경우.
+            Exception: leader의 작업이 실패한 경우 그 오류.
+        """
+        if not call.done.wait(timeout):
+            raise TimeoutError("single-flight wait timed out")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do(self, key, fn, timeout=None):
+        """fn()을 실행하거나, 같은 키의 진행 중인 실행 결과를 공유합니다."""
+        call, leader = self.begin(key)
+        if not leader:
+            return self.wait(call, timeout)
+        try:
+            result = fn()
+        except Exception as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result=result)
+        return result
@@ -0,0 +1,156 @@
+import math
+import re
+from collections import Counter
+
+# 기본 프롬프트 본문 예산 (토큰). 이전의 text[:3000] (영문 기준 약 750 토큰)과 비슷한 크기
+DEFAULT_MAX_TOKENS = 768
+# 이보다 짧은 문장은 메뉴/캡션/바이라인 같은 잡음으로 보고 점수를 낮춤
+MIN_SENTENCE_CHARS = 20
+# 리드 문단 가중치: 앞쪽 문장일수록 기사 핵심일 가능성이 높음
+LEAD_SENTENCES = 3
+LEAD_BONUS = 0.5
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?。])\s+|\n+')
+_WORD = re.compile(r'\w+', re.UNICODE)
+_HANGUL = re.compile(r'[가-힣]')
+_BOILERPLATE = re.compile(
+    r'(무단\s*전재|재배포\s*금지|저작권자|기자\s*[\w.-]+@|구독|copyright|all rights reserved|subscribe)',
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text):
+    """
+    토큰 수를 대략 추정합니다.
+
+    한글은 음절당 약 1 토큰, 그 외(영문/숫자/공백)는 4자당 약 1 토큰으로 계산합니다.
+    """
+    hangul = len(_HANGUL.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def split_sentences(text):
+    """문장 부호와 줄바꿈을 기준으로 문장을 나눕니다 (빈 문장과 중복 문장 제외)."""
+    sentences = []
+    seen = set()
+    for part in _SENTENCE_SPLIT.split(text):
+        part = part.strip()
+        if part and part not in seen:
+            seen.add(part)
+            sentences.append(part)
+    return sentences
+
+
+def _terms(sentence):
+    """
+    문장의 용어 목록. 한글 어절은 조사가 붙어 형태가 달라지므로 앞 두 음절도 함께 사용합니다.
+    """
+    terms = []
+    for word in _WORD.findall(sentence.lower()):
+        if len(word) < 2 or word.isdigit():
+            continue
+        terms.append(word)
+        if _HANGUL.match(word) and len(word) > 2:
+            terms.append(word[:2])
+    return terms
+
+
+def score_sentences(sentences):
+    """
+    각 문장의 중요도 점수를 계산합니다.
+
+    기사 전체에서 자주 등장하는 용어(문서 내 빈도, 로그 스케일)를 많이 포함할수록 높고,
+    문장 길이의 제곱근으로 정규화해 긴 문장이 무조건 유리하지 않게 합니다.
+    리드 문장은 가산점, 짧은 문장과 저작권/구독 안내 같은 상투 문구는 감점합니다.
+    """
+    sentence_terms = [_terms(s) for s in sentences]
+    # 문장 빈도: 한 문장 안에서 반복된 용어는 한 번만 셈
+    df = Counter()
+    for terms in sentence_terms:
+        df.update(set(terms))
+    weights = {term: math.log1p(count) for term, count in df.items() if count > 1}
+
+    scores = []
+    for i, (sentence, terms) in enumerate(zip(sentences, sentence_terms)):
+        if not terms:
+            scores.append(0.0)
+            continue
+        score = sum(weights.get(t, 0.0) for t in set(terms)) / math.sqrt(len(terms))
+        if i < LEAD_SENTENCES:
+            score *= 1 + LEAD_BONUS
+        if len(sentence) < MIN_SENTENCE_CHARS:
+            score *= 0.2
+        if _BOILERPLATE.search(sentence):
+            score *= 0.1
+        scores.append(score)
+    return scores
+
+
+def compress(text, max_tokens=DEFAULT_MAX_TOKENS):
+    """
+    토큰 예산 안에서 점수가 높은 문장을 골라 원래 순서대로 이어 붙입니다.
+
+    텍스트가 이미 예산 안이면 그대로 반환합니다. 한 문장도 예산에 들어가지 않으면
+    가장 점수가 높은 문장을 예산 길이만큼 잘라 반환합니다.
+
+    Args:
+        text (str): 추출된 기사 본문.
+        max_tokens (int): estimate_tokens() 기준 최대 토큰 수.
+
+    Returns:
+        str: 압축된 본문.
+    """
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text
+
+    sentences = split_sentences(text)
+    scores = score_sentences(sentences)
+    ranked = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)
+
+    chosen = []
+    used = 0
+    for i in ranked:
+        if scores[i] <= 0:
+            # 기사 내 다른 문장과 공유하는 용어가 없는 문장 (번호, 코드 조각 등)
+            break
+        cost = estimate_tokens(sentences[i]) + 1
+        if used + cost > max_tokens:
+            continue
+        chosen.append(i)
+        used += cost
+
+    if not chosen:
+        best = sentences[ranked[0]]
+        # 한글 비중과 관계없이 예산을 넘지 않도록 보수적으로 자름
+        return best[:max_tokens]
+    return "\n".join(sentences[i] for i in sorted(chosen))
+
+
+def chunk(text, max_tokens=DEFAULT_MAX_TOKENS):
+    """
+    본문을 문장 경계에서 나눠 각각 토큰 예산 안에 드는 연속된 조각으로 만듭니다.
+
+    예산보다 긴 문장은 예산 길이(문자 수)로 잘라 별도 조각으로 만듭니다.
+
+    Returns:
+        list: 원래 순서의 조각 문자열 목록.
+    """
+    chunks = []
+    current = []
+    used = 0
+    for sentence in split_sentences(text or ""):
+        cost = estimate_tokens(sentence) + 1
+        if cost > max_tokens:
+            if current:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            chunks.extend(sentence[i:i + max_tokens] for i in range(0, len(sentence), max_tokens))
+            continue
+        if used + cost > max_tokens and current:
+            chunks.append("\n".join(current))
+            current, used = [], 0
+        current.append(sentence)
+        used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
@@ -1,6 +1,9 @@
 import streamlit as st
 import queue
-from modules.metrics_manager import DataUsageTracker
+from modules.metrics_manager import DataUsageTracker, LATENCY
+from modules.news_manager import get_database
+from modules.llm_router import ROUTER
+from modules.circuit_breaker import get_breakers
 
 def render_sidebar(llm_manager, fetcher):
     """
@@ -119,6 +122,13 @@ def render_sidebar(llm_manager, fetcher):
 
         st.caption(f"**Host:** {llm_manager.current_host_label}")
 
+        if llm_manager.is_balanced():
+            # 라우팅 풀의 호스트별 상태 (EWMA 지연, 진행 중 요청 수)
+            for host in ROUTER.snapshot():
+                status = "🟢" if host['healthy'] else "🔴"
+                latency = f"{host['ewma_ms']:.0f} ms" if host['ewma_ms'] is not None else "-"
+                st.caption(f"{status} {host['name']}: {latency}, {host['in_flight']} in flight")
+
         # Display Cached GPU Info
         if 'gpu_info' in st.session_state and st.session_state.gpu_info:
             gpu_info = st.session_state.gpu_info
@@ -159,6 +169,43 @@ def render_sidebar(llm_manager, fetcher):
         </div>
     </div>
     """, unsafe_allow_html=True)
+
+        breakdown = [(f"Source · {k}", v) for k, v in stats['by_source'].items()]
+        breakdown += [(f"LLM · {k}", v) for k, v in stats['by_provider'].items()]
+        if breakdown:
+            with st.expander("Usage by source / provider"):
+                for label, usage in breakdown:
+                    st.caption(f"{label}: Rx {format_bytes(usage['rx'])} / Tx {format_bytes(usage['tx'])}")
+
+        breakers = get_breakers().snapshot()
+        if breakers:
+            # 호스트별 서킷 브레이커 상태 (open/half-open이면 펼쳐서 표시)
+            tripped = any(b['state'] != "closed" for b in breakers)
+            with st.expander("Circuit breakers", expanded=tripped):
+                icons = {"closed": "🟢", "half-open": "🟡", "open": "🔴"}
+                for b in breakers:
+                    p95 = ", ".join(f"{kind} p95 {ms:.0f} ms" for kind, ms in b['p95_ms'].items())
+                    st.caption(f"{icons[b['state']]} {b['name']}: {b['state']}" + (f" · {p95}" if p95 else ""))
+                    if b['state'] != "closed" and b['last_error']:
+                        st.caption(f"↳ {b['last_error'][:120]}")
+
+        with st.expander("Latency"):
+            cache_stats = get_database().get_cache_stats()
+            st.caption(
+                f"Summary cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                f"({cache_stats['hit_rate']:.0%})"
+            )
+            rows = LATENCY.snapshot()
+            if rows:
+                st.dataframe(rows, hide_index=True, use_container_width=True)
+                st.download_button(
+                    "Export (Prometheus)",
+                    LATENCY.render_prometheus(),
+                    file_name="news_reader_metrics.txt",
+                    mime="text/plain",
+                )
+            else:
+                st.caption("No samples yet.")
     
     # Return necessary state for the main loop
     refresh_int = refresh_interval if mode == "Live News" else 0
@@ -1,20 +1,159 @@
-import time
-from modules.news_manager import NewsDatabase
 
-def auto_sum_worker(news_items, model, result_queue, stop_event, fetcher_instance):
-    """뉴스 텍스트를 가져오고 요약하는 백그라운드 스레드"""
-    
+import logging
+import queue
+import threading
+from modules.news_manager import _ARTICLE_FLIGHTS, SINGLE_FLIGHT_TIMEOUT, get_database
+
+logger = logging.getLogger(__name__)
+
+# 단계 사이 큐에서 작업 종료를 알리는 값
+_DONE = object()
+
+
+class SummaryPipeline:
+    """
+    자동 요약을 단계별로 병렬 처리하는 파이프라인.
+
+    캐시 확인 -> 본문 다운로드 -> 텍스트 추출 -> 요약 순서로 진행하며, 각 단계는
+    자체 워커 스레드와 크기가 제한된 입력 큐를 가집니다. 따라서 LLM이 한 기사를
+    요약하는 동안 다음 기사들이 다운로드/추출됩니다.
+
+    속성:
+        download_workers (int): 다운로드 단계 스레드 수 (pipeline.download_workers).
+        extract_workers (int): 추출 단계 스레드 수 (pipeline.extract_workers).
+        summary_workers (int): 요약 단계 스레드 수 (LLM 제공자별 동시성).
+        queue_size (int): 단계 사이 큐의 최대 크기 (pipeline.queue_size).
+    """
+    def __init__(self, fetcher, model, result_queue, stop_event):
+        self.fetcher = fetcher
+        self.model = model
+        self.result_queue = result_queue
+        self.stop_event = stop_event
+
+        pipeline_config = fetcher.config.get('pipeline', {})
+        self.download_workers = max(1, int(pipeline_config.get('download_workers', 4)))
+        self.extract_workers = max(1, int(pipeline_config.get('extract_workers', 2)))
+        self.summary_workers = fetcher.llm_manager.get_concurrency()
+        self.queue_size = max(1, int(pipeline_config.get('queue_size', 8)))
+
+    def _put(self, q, value):
+        """중지 요청을 확인하면서 제한된 큐에 값을 넣습니다."""
+        while not self.stop_event.is_set():
+            try:
+                q.put(value, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _start_stage(self, name, handler, in_q, out_q, workers):
+        """
+        in_q의 항목을 handler로 처리해 out_q로 보내는 스레드들을 시작합니다.
+        모든 스레드가 끝나면 out_q에 종료 신호를 넣는 감시 스레드를 반환합니다.
+        """
+        def run():
+            while True:
+                job = in_q.get()
+                if job is _DONE:
+                    in_q.put(_DONE)  # 같은 단계의 다른 스레드에도 전달
+                    return
+                if self.stop_event.is_set():
+                    self._release(job)
+                    continue
+                try:
+                    output = handler(job)
+                except Exception as e:
+                    logger.error(f"Auto sum {name} error: {e}")
+                    continue
+                if output is not None and out_q is not None:
+                    if not self._put(out_q, output):
+                        self._release(output)
+
+        threads = [threading.Thread(target=run, name=f"autosum-{name}-{i}", daemon=True) for i in range(workers)]
+        for t in threads:
+            t.start()
+
+        def close():
+            for t in threads:
+                t.join()
+            if out_q is not None:
+                out_q.put(_DONE)
+
+        closer = threading.Thread(target=close, name=f"autosum-{name}-close", daemon=True)
+        closer.start()
+        return closer
 
-    for item in news_items:
-        if stop_event.is_set():
-            break
-            
+    def _release(self, job):
+        """중지로 버려지는 작업이 잡고 있던 기사 single-flight를 해제합니다."""
+        if isinstance(job, tuple) and len(job) == 4 and job[3] is not None:
+            link, call = job[3]
+            _ARTICLE_FLIGHTS.finish(link, call, error=RuntimeError("auto summary stopped"))
+
+    def _download(self, item):
+        """
+        get_full_text()와 같은 single-flight 키(URL)로 기사를 가져옵니다.
+
+        다른 세션/스레드가 같은 기사를 가져오는 중이면 그 텍스트를 기다리고, 직접
+        다운로드한 경우에는 추출 단계가 flight를 끝낼 수 있도록 작업에 함께 넘깁니다.
+        """
         link = item['link']
-        
+        call, leader = _ARTICLE_FLIGHTS.begin(link)
+        if not leader:
+            try:
+                return (item, None, _ARTICLE_FLIGHTS.wait(call, SINGLE_FLIGHT_TIMEOUT), None)
+            except Exception as e:
+                logger.error(f"Error fetching text: {e}")
+                return (item, None, f"Error fetching content: {e}", None)
         try:
-            # 1. DB 캐시 먼저 확인
-            db_local = NewsDatabase()
-            cached_data = db_local.get_summary_from_cache(link)
+            text, response = self.fetcher.download_article_cached(link)
+        except Exception as e:
+            _ARTICLE_FLIGHTS.finish(link, call, error=e)
+            logger.error(f"Error fetching text: {e}")
+            # get_full_text와 동일하게 오류 메시지를 본문으로 전달
+            return (item, None, f"Error fetching content: {e}", None)
+        if text is not None:
+            _ARTICLE_FLIGHTS.finish(link, call, result=text)
+            return (item, None, text, None)
+        return (item, response, None, (link, call))
+
+    def _extract(self, job):
+        item, response, text, flight = job
+        if flight is None:
+            return (item, text)
+        link, call = flight
+        try:
+            text = self.fetcher.extract_text(response.content, link)
+            self.fetcher.store_article_text(link, response, text)
+        except Exception as e:
+            _ARTICLE_FLIGHTS.finish(link, call, error=e)
+            raise
+        _ARTICLE_FLIGHTS.finish(link, call, result=text)
+        return (item, text)
+
+    def _summarize(self, job):
+        item, text = job
+        link = item['link']
+        # 첫 단계의 일괄 조회 이후 다른 세션이 캐시에 저장했을 수 있으므로 캐시를 다시 확인
+        summary_data = self.fetcher.generate_summary(text, self.model, link=link, force_refresh=False)
+        if summary_data:
+            # single-flight로 다른 호출자와 공유하는 dict이므로 복사한 뒤 전체 텍스트를 추가
+            # (메인 스레드가 세션 상태에 캐시할 수 있도록)
+            summary_data = dict(summary_data)
+            summary_data['full_text'] = text
+            self.result_queue.put((link, summary_data))
+
+    def run(self, news_items):
+        """모든 항목이 처리되거나 stop_event가 설정될 때까지 실행합니다."""
+        # 1. DB 캐시를 한 번에 확인 (항목당 쿼리 대신 한 번의 IN 쿼리)
+        try:
+            cached_map = get_database().get_summaries_from_cache([item['link'] for item in news_items])
+        except Exception as e:
+            logger.error(f"Auto sum cache error: {e}")
+            cached_map = {}
+
+        pending = []
+        for item in news_items:
+            cached_data = cached_map.get(item['link'])
             if cached_data:
                 # generate_summary 반환 형식에 맞게 래핑
                 formatted_result = {
@@ -27,20 +166,29 @@ def auto_sum_worker(news_items, model, result_queue, stop_event, fetcher_instanc
                     },
                     'full_text': None
                 }
-                result_queue.put((link, formatted_result))
-                continue
-            
-            # 2. 텍스트 가져오기 (백그라운드)
-            text = fetcher_instance.get_full_text(link)
-            
-            # 3. {text, meta} 생성
-            summary_data = fetcher_instance.generate_summary(text, model, link=link)
-            
-            # 메인 스레드가 세션 상태에 캐시할 수 있도록 전체 텍스트를 결과에 추가
-            if summary_data:
-                summary_data['full_text'] = text
-                result_queue.put((link, summary_data))
-            
-            time.sleep(1) # 양보 (Yield)
-        except Exception as e:
-            print(f"Auto sum error: {e}")
+                self.result_queue.put((item['link'], formatted_result))
+            else:
+                pending.append(item)
+
+        if not pending:
+            return
+
+        download_q = queue.Queue(maxsize=self.queue_size)
+        extract_q = queue.Queue(maxsize=self.queue_size)
+        summary_q = queue.Queue(maxsize=self.queue_size)
+
+        # 2~4. 다운로드 -> 추출 -> 요약 단계 시작
+        self._start_stage("download", self._download, download_q, extract_q, self.download_workers)
+        self._start_stage("extract", self._extract, extract_q, summary_q, self.extract_workers)
+        last = self._start_stage("summarize", self._summarize, summary_q, None, self.summary_workers)
+
+        for item in pending:
+            if not self._put(download_q, item):
+                break
+        download_q.put(_DONE)
+        last.join()
+
+
+def auto_sum_worker(news_items, model, result_queue, stop_event, fetcher_instance):
+    """뉴스 텍스트를 가져오고 요약하는 백그라운드 스레드 (SummaryPipeline 실행)"""
+    SummaryPipeline(fetcher_instance, model, result_queue, stop_event).run(news_items)